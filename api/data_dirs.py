@@ -8,11 +8,13 @@ Struktura:
       export/    ← exportované soubory + instrument-definition.json
 """
 
+import os
 import re
 from pathlib import Path
+from typing import AbstractSet, FrozenSet, Iterable, List
 
 DATA_ROOT = Path(__file__).resolve().parent.parent / "data"
-AUDIO_EXTENSIONS = {".wav", ".aif", ".aiff", ".flac"}
+AUDIO_EXTENSIONS = frozenset({".wav", ".aif", ".aiff", ".flac"})
 
 _VALID_SESSION_NAME = re.compile(r'^[a-zA-Z0-9_\-]{1,64}$')
 
@@ -38,3 +40,53 @@ def samples_dir(session_name: str) -> Path:
 
 def export_dir(session_name: str) -> Path:
     return _safe_session_path(session_name, "export")
+
+
+def normalize_extensions(extensions: Iterable[str]) -> FrozenSet[str]:
+    """Převede přípony/vzory ('*.WAV', 'wav', '.Wav') na množinu '.wav'.
+
+    Varianty lišící se jen velikostí písmen splynou, takže složka
+    se prochází jen jednou bez ohledu na zadání.
+    """
+    normalized = set()
+    for ext in extensions:
+        ext = ext.strip().lstrip("*").lower()
+        if not ext:
+            continue
+        normalized.add(ext if ext.startswith(".") else "." + ext)
+    return frozenset(normalized)
+
+
+def scan_audio_files(
+    folder: Path,
+    extensions: AbstractSet[str] = AUDIO_EXTENSIONS,
+    recursive: bool = False,
+) -> List[str]:
+    """Vrátí seřazené cesty k audio souborům ve složce.
+
+    Jeden průchod os.scandir na adresář — typ položky se bere z výpisu
+    adresáře, bez stat() a bez pathlib objektů pro každý soubor.
+    S recursive=True prochází podsložky iterativně přes zásobník
+    (symlinky na adresáře se nenásledují, takže nehrozí cyklus);
+    nečitelné podsložky se přeskočí.
+    """
+    files: List[str] = []
+    top = os.fspath(folder)
+    stack = [top]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            # Nečitelná podsložka se přeskočí, chyba kořenové složky se propaguje
+            if path == top:
+                raise
+            continue
+        with it:
+            for entry in it:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions:
+                    files.append(entry.path)
+    files.sort()
+    return files
@@ -8,6 +8,7 @@ Analyze endpoints:
 """
 
 import asyncio
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +29,7 @@ from src.domain.models.sample import SampleMetadata
 router = APIRouter()
 
 _DATA_ROOT = DATA_ROOT.resolve()
+_is_analyzed = attrgetter("analyzed")
 
 
 def _resolve_safe_path(file_path: str) -> Path:
@@ -149,7 +151,7 @@ def analyze_batch(
             results.append(_sample_to_result(s, success=s.analyzed))
 
         if request.session_name:
-            analyzed = [s for s in to_analyze if s.analyzed]
+            analyzed = list(filter(_is_analyzed, to_analyze))
             if analyzed:
                 session_service.cache_analyzed_samples(analyzed)
 
@@ -166,7 +168,7 @@ async def analyze_batch_ws(websocket: WebSocket):
 
     Protokol (server → klient):
       {"type": "start",    "total": N}
-      {"type": "progress", "current": N, "total": M, "filename": "..."}
+      {"type": "progress", "current": N, "total": M, "filename": "..."}   ← jen při změně procenta
       {"type": "result",   "filename": "...", "success": bool, ...}
       {"type": "done",     "successful": N, "failed": M, "from_cache": K}
       {"type": "error",    "message": "..."}
@@ -201,8 +203,9 @@ async def analyze_batch_ws(websocket: WebSocket):
         from_cache_count = 0
         to_analyze = samples
         if session_name:
-            session_service.load_session(session_name)
-            cached, to_analyze = session_service.analyze_with_cache(samples)
+            # Načtení session a hashování souborů je blokující I/O — mimo event loop
+            await asyncio.to_thread(session_service.load_session, session_name)
+            cached, to_analyze = await asyncio.to_thread(session_service.analyze_with_cache, samples)
             from_cache_count = len(cached)
             for s in cached:
                 await websocket.send_json({
@@ -213,14 +216,20 @@ async def analyze_batch_ws(websocket: WebSocket):
 
         successful = from_cache_count
         failed = 0
+        last_pct = -1
 
         for i, sample in enumerate(to_analyze, 1):
-            await websocket.send_json({
-                "type": "progress",
-                "current": from_cache_count + i,
-                "total": total,
-                "filename": sample.filename,
-            })
+            # Progress jen při změně celého procenta — nejvýš 100 zpráv na dávku
+            current = from_cache_count + i
+            pct = current * 100 // total
+            if pct != last_pct:
+                last_pct = pct
+                await websocket.send_json({
+                    "type": "progress",
+                    "current": current,
+                    "total": total,
+                    "filename": sample.filename,
+                })
 
             # Blokující analýza v thread poolu — neblokuje event loop
             ok = await asyncio.to_thread(analysis_service.analyze_sample, sample)
@@ -237,9 +246,9 @@ async def analyze_batch_ws(websocket: WebSocket):
                 failed += 1
 
         if session_name and to_analyze:
-            analyzed = [s for s in to_analyze if s.analyzed]
+            analyzed = list(filter(_is_analyzed, to_analyze))
             if analyzed:
-                session_service.cache_analyzed_samples(analyzed)
+                await asyncio.to_thread(session_service.cache_analyzed_samples, analyzed)
 
         await websocket.send_json({
             "type": "done",
@@ -8,14 +8,15 @@ File management endpoints:
 """
 
 import io
+import os
 import zipfile
-from pathlib import Path
+from operator import itemgetter
 from typing import List
 
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from fastapi.responses import StreamingResponse, FileResponse
 
-from api.data_dirs import samples_dir, export_dir, AUDIO_EXTENSIONS
+from api.data_dirs import samples_dir, export_dir, scan_audio_files, AUDIO_EXTENSIONS
 
 router = APIRouter()
 
@@ -32,15 +33,15 @@ async def upload_files(
     saved, skipped = [], []
 
     for f in files:
-        suffix = Path(f.filename).suffix.lower()
-        if suffix not in AUDIO_EXTENSIONS:
+        fname = os.path.basename(f.filename)
+        if os.path.splitext(fname)[1].lower() not in AUDIO_EXTENSIONS:
             skipped.append(f.filename)
             continue
         content = await f.read()
         if len(content) > _MAX_UPLOAD_BYTES:
             skipped.append(f.filename)
             continue
-        dest = dest_dir / Path(f.filename).name
+        dest = dest_dir / fname
         dest.write_bytes(content)
         saved.append(str(dest))
 
@@ -54,37 +55,34 @@ async def upload_files(
 @router.get("/files/{name}/samples")
 def list_samples(name: str):
     """Vrátí seznam nahraných souborů v session."""
-    d = samples_dir(name)
-    files = sorted(
-        str(f) for f in d.iterdir()
-        if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
-    )
+    files = scan_audio_files(samples_dir(name))
     return {"files": files, "count": len(files)}
 
 
 @router.get("/files/{name}/export")
 def list_export(name: str):
     """Vrátí seznam souborů v export složce."""
-    d = export_dir(name)
-    files = sorted(
-        [{"name": f.name, "size": f.stat().st_size, "path": str(f)} for f in d.iterdir() if f.is_file()],
-        key=lambda x: x["name"],
-    )
+    with os.scandir(export_dir(name)) as it:
+        files = [
+            {"name": e.name, "size": e.stat().st_size, "path": e.path}
+            for e in it if e.is_file()
+        ]
+    files.sort(key=itemgetter("name"))
     return {"files": files, "count": len(files)}
 
 
 @router.get("/files/{name}/export/zip")
 def download_export_zip(name: str):
     """Stáhne celý export jako ZIP archiv."""
-    d = export_dir(name)
-    file_list = [f for f in d.iterdir() if f.is_file()]
+    with os.scandir(export_dir(name)) as it:
+        file_list = sorted((e.name, e.path) for e in it if e.is_file())
     if not file_list:
         raise HTTPException(status_code=404, detail="Export složka je prázdná.")
 
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for f in file_list:
-            zf.write(f, f.name)
+        for fname, fpath in file_list:
+            zf.write(fpath, fname)
     buf.seek(0)
 
     zip_name = f"{name}_export.zip"
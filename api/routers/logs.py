@@ -29,15 +29,29 @@ class SseLogHandler(logging.Handler):
         self.setFormatter(logging.Formatter("%(name)s — %(message)s"))
 
     def emit(self, record: logging.LogRecord) -> None:
+        # Zpráva se naformátuje hned (pod zámkem handleru, jako QueueHandler.prepare),
+        # takže se do queue nedostanou měnitelné args ani traceback s rámci.
+        # Do SSE konzumenta se odkládá jen strftime časové značky.
         try:
-            self._q.put_nowait({
-                "level": record.levelname,
-                "msg": self.format(record),
-                "time": datetime.fromtimestamp(record.created).strftime("%H:%M:%S"),
-            })
+            entry = (record.levelname, self.format(record), record.created)
+        except Exception:
+            self.handleError(record)
+            return
+        try:
+            self._q.put_nowait(entry)
         except queue.Full:
             pass  # zahoď nový záznam, queue je plná
 
+    @staticmethod
+    def to_payload(entry: tuple) -> dict:
+        """Převede zařazený záznam (level, zpráva, created) na JSON payload pro klienta."""
+        level, msg, created = entry
+        return {
+            "level": level,
+            "msg": msg,
+            "time": datetime.fromtimestamp(created).strftime("%H:%M:%S"),
+        }
+
 
 # Singleton handler — sdílen celou aplikací
 _handler: SseLogHandler | None = None
@@ -55,8 +69,8 @@ async def _event_generator(handler: SseLogHandler):
     keepalive = 0
     while True:
         try:
-            record = handler._q.get_nowait()
-            yield f"data: {json.dumps(record, ensure_ascii=False)}\n\n"
+            entry = handler._q.get_nowait()
+            yield f"data: {json.dumps(handler.to_payload(entry), ensure_ascii=False)}\n\n"
             keepalive = 0
         except queue.Empty:
             await asyncio.sleep(0.1)
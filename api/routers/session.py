@@ -19,7 +19,7 @@ from api.schemas import (
     FolderScanRequest, FolderScanResponse,
 )
 from api.dependencies import get_session_service
-from api.data_dirs import DATA_ROOT
+from api.data_dirs import DATA_ROOT, normalize_extensions, scan_audio_files
 from src.application.services.session_service import SessionService
 
 _VALID_SESSION_NAME = re.compile(r'^[a-zA-Z0-9_\-]{1,64}$')
@@ -121,9 +121,7 @@ def scan_folder(
     if not folder.exists() or not folder.is_dir():
         raise HTTPException(status_code=400, detail="Složka neexistuje.")
 
-    extensions = {ext.lower() for ext in request.extensions}
-    files: List[str] = [
-        str(f) for f in sorted(folder.iterdir())
-        if f.is_file() and f.suffix.lower() in extensions
-    ]
+    files: List[str] = scan_audio_files(
+        folder, normalize_extensions(request.extensions), recursive=request.recursive
+    )
     return FolderScanResponse(files=files, count=len(files))
@@ -27,11 +27,15 @@ logging.basicConfig(
 
 import uvicorn
 
+# Úvodní text jako jediný literál — při startu se jen jednou naformátuje
+_BANNER = """Sample Editor API startuje na http://127.0.0.1:8000
+Dokumentace API: http://127.0.0.1:8000/docs
+Log soubor: {log_file}
+Stiskni Ctrl+C pro zastavení.
+"""
+
 if __name__ == "__main__":
-    print(f"Sample Editor API startuje na http://127.0.0.1:8000")
-    print(f"Dokumentace API: http://127.0.0.1:8000/docs")
-    print(f"Log soubor: {log_file}")
-    print("Stiskni Ctrl+C pro zastavení.\n")
+    print(_BANNER.format(log_file=log_file))
 
     uvicorn.run(
         "api.main:app",
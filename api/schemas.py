@@ -88,6 +88,7 @@ class FolderScanRequest(BaseModel):
     """Skenování složky se soubory."""
     folder_path: str
     extensions: List[str] = [".wav", ".flac", ".aif", ".aiff"]
+    recursive: bool = False
 
 
 class FolderScanResponse(BaseModel):
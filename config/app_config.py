@@ -42,6 +42,9 @@ class CacheConfig:
     # Chunk sizes
     FILE_CHUNK_SIZE = 8192  # 8KB pro čtení souborů (hash)
 
+    # Max. počet zapamatovaných MD5 hashů (LRU) v Md5CacheManager
+    HASH_MEMO_MAX_ENTRIES = 4096
+
     # Cache file naming
     CACHE_FILENAME = "cache.json"
     CACHE_BACKUP_SUFFIX = ".backup"
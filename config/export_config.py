@@ -118,6 +118,8 @@ class AudioExportParams:
 
     # Resampling
     RESAMPLE_QUALITY = 'kaiser_best'  # librosa kvalita
+    STREAM_QUALITY = 'HQ'  # soxr kvalita pro streamovaný resampling
+    STREAM_BLOCK_SIZE = 1 << 16  # Počet framů na blok při streamování
 
     # Audio formát
     FORMAT_WAV = 'WAV'
@@ -139,6 +141,9 @@ class BatchProcessing:
     # Chunk size pro batch processing
     BATCH_SIZE = 10  # Zpracovat 10 samples najednou
 
+    # Paralelní export (počet vláken pro zápis/resampling samples)
+    MAX_WORKERS = 4
+
     # Update interval pro progress
     PROGRESS_UPDATE_INTERVAL = 1  # Update každý sample
 
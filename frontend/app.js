@@ -5,37 +5,73 @@
 
 const API = 'http://127.0.0.1:8000/api/v1';
 
-/** Escapuje HTML speciální znaky — zabraňuje XSS při vkládání do innerHTML. */
-function escHtml(str) {
-  return String(str)
-    .replace(/&/g, '&amp;')
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#39;');
-}
-
 // ── Stav aplikace ────────────────────────────────────────
 let state = {
   session: null,          // název aktuální session
   velLayers: 8,           // počet velocity vrstev
   samples: [],            // [ { filename, file_path, detected_midi, velocity_amplitude, ... } ]
   mapping: {},            // { "midi_vel": { ...sample } }  klíč = "60_3"
+  mappedCount: 0,         // počet obsazených buněk (udržováno při změnách mapping)
   dragSample: null,       // sample právě přetahovaný
 };
 
 // MIDI noty — A0 (21) až C8 (108)
 const NOTE_NAMES = ['C','C#','D','D#','E','F','F#','G','G#','A','A#','B'];
+
+// Předpočítané názvy not a popisky "C4 (60)" pro všech 128 MIDI hodnot
+const NOTE_NAME_CACHE = Array.from({ length: 128 }, (_, n) => NOTE_NAMES[n % 12] + (Math.floor(n / 12) - 1));
+const NOTE_LABEL_CACHE = NOTE_NAME_CACHE.map((name, n) => `${name} (${n})`);
+
 function midiToName(n) {
-  const oct = Math.floor(n / 12) - 1;
-  return NOTE_NAMES[n % 12] + oct;
+  return NOTE_NAME_CACHE[n] ?? NOTE_NAMES[((n % 12) + 12) % 12] + (Math.floor(n / 12) - 1);
 }
 
+function midiLabel(n) {
+  return NOTE_LABEL_CACHE[n] ?? `${midiToName(n)} (${n})`;
+}
+
+// Texty tlačítek a štítků sdílené všemi voláními
+const LABELS = {
+  analyze:     '🔍 Analyzovat',
+  analyzeBusy: '⏳ Analyzuji…',
+  export:      '⬇ Export Ithaca',
+  exportBusy:  '⏳ Exportuji…',
+  sf2:         '⬇ Export SF2',
+  sf2Busy:     '⏳ Generuji SF2…',
+  notAnalyzed: 'neanalyzováno',
+};
+
+// Tlačítka, která se povolí po načtení session
+const SESSION_BUTTONS = ['btn-scan', 'btn-analyze', 'btn-export', 'btn-export-sf2'];
+
 // ── Helpers ──────────────────────────────────────────────
+// Všechny prvky jsou statické v index.html — stačí je vyhledat jednou
+const _elCache = new Map();
+function $id(id) {
+  let el = _elCache.get(id);
+  if (!el) {
+    el = document.getElementById(id);
+    if (el) _elCache.set(id, el);
+  }
+  return el;
+}
+
+// Stavový řádek se zapisuje nejvýš jednou za snímek — při rychlém sledu
+// zpráv (progress po souborech) se zobrazí jen poslední
+let _statusPending = null;
+
 function status(msg, type = '') {
-  const el = document.getElementById('status-bar');
+  if (_statusPending === null) requestAnimationFrame(_flushStatus);
+  _statusPending = { msg, type };
+}
+
+function _flushStatus() {
+  const { msg, type } = _statusPending;
+  _statusPending = null;
+  const el = $id('status-bar');
   el.textContent = msg;
-  el.className = type;
+  // Přepis třídy (i na stejnou hodnotu) invaliduje styly — měň jen při změně stavu
+  if (el.className !== type) el.className = type;
 }
 
 async function api(method, path, body = null) {
@@ -49,14 +85,14 @@ async function api(method, path, body = null) {
   return res.json();
 }
 
-function openModal(id)  { document.getElementById(id).classList.add('open'); }
-function closeModal(id) { document.getElementById(id).classList.remove('open'); }
+function openModal(id)  { $id(id).classList.add('open'); }
+function closeModal(id) { $id(id).classList.remove('open'); }
 
 // ── Session ──────────────────────────────────────────────
 async function loadSessionList() {
   try {
     const data = await api('GET', '/session/list');
-    const sel = document.getElementById('session-select');
+    const sel = $id('session-select');
     sel.innerHTML = '<option value="">— vybrat session —</option>';
     data.sessions.forEach(name => {
       const opt = document.createElement('option');
@@ -75,13 +111,12 @@ async function loadSession(name) {
     const info = await api('GET', `/session/${encodeURIComponent(name)}`);
     state.session = name;
     state.velLayers = info.velocity_layers || 8;
-    document.getElementById('vel-layers').value = state.velLayers;
-    document.getElementById('session-label').textContent = `Session: ${name}  (${state.velLayers} vel. vrstev)`;
-    document.getElementById('btn-scan').disabled = false;
-    document.getElementById('btn-analyze').disabled = false;
-    document.getElementById('btn-export').disabled = false;
-    document.getElementById('btn-export-sf2').disabled = false;
-    rebuildMatrix();
+    $id('vel-layers').value = state.velLayers;
+    $id('session-label').textContent = `Session: ${name}  (${state.velLayers} vel. vrstev)`;
+    SESSION_BUTTONS.forEach(id => { $id(id).disabled = false; });
+    // Vrstvy už jsou ve state — matice se vykreslí hned jedním průchodem,
+    // ne přes debounce vstupu (ten by stejnou hodnotu přeskočil)
+    renderMatrix();
     status(`Session "${name}" načtena.`, 'ok');
     await loadUploadedSamples();
   } catch (e) {
@@ -92,10 +127,10 @@ async function loadSession(name) {
 function openNewSessionModal() { openModal('modal-new-session'); }
 
 async function createSession() {
-  const name = document.getElementById('ns-name').value.trim();
+  const name = $id('ns-name').value.trim();
   if (!name) { alert('Zadej název session.'); return; }
-  const vel = parseInt(document.getElementById('ns-vel').value) || 8;
-  const instrument = document.getElementById('ns-instrument').value.trim();
+  const vel = parseInt($id('ns-vel').value) || 8;
+  const instrument = $id('ns-instrument').value.trim();
   try {
     status('Vytvářím session…');
     await api('POST', '/session', {
@@ -104,7 +139,7 @@ async function createSession() {
     });
     closeModal('modal-new-session');
     await loadSessionList();
-    document.getElementById('session-select').value = name;
+    $id('session-select').value = name;
     await loadSession(name);
   } catch (e) {
     status('Chyba: ' + e.message, 'error');
@@ -113,7 +148,7 @@ async function createSession() {
 
 // ── Upload souborů ────────────────────────────────────────
 function triggerUpload() {
-  document.getElementById('upload-input').click();
+  $id('upload-input').click();
 }
 
 function handleFileInputChange(input) {
@@ -164,8 +199,8 @@ async function loadUploadedSamples() {
 }
 
 function setUploadProgress(done, total) {
-  const fill = document.getElementById('upload-progress-fill');
-  const hint = document.getElementById('upload-hint');
+  const fill = $id('upload-progress-fill');
+  const hint = $id('upload-hint');
   if (!total) {
     fill.style.width = '0%';
     hint.textContent = '↑ přetáhni WAV/AIF sem';
@@ -178,8 +213,11 @@ function setUploadProgress(done, total) {
 
 // ── Drag-drop nahrávání na dropzone ──────────────────────
 function initUploadDropzone() {
-  const zone = document.getElementById('upload-dropzone');
-  zone.addEventListener('dragover', e => { e.preventDefault(); zone.classList.add('dz-over'); });
+  const zone = $id('upload-dropzone');
+  zone.addEventListener('dragover', e => {
+    e.preventDefault();
+    if (!zone.classList.contains('dz-over')) zone.classList.add('dz-over');
+  });
   zone.addEventListener('dragleave', () => zone.classList.remove('dz-over'));
   zone.addEventListener('drop', e => {
     e.preventDefault();
@@ -193,31 +231,74 @@ function initUploadDropzone() {
 }
 
 // ── Analýza ──────────────────────────────────────────────
+// Výsledky z WebSocketu se do seznamu propisují po dávkách — jeden render
+// na 16 výsledků nebo 200 ms, ne na každý soubor
+const ANALYZE_BATCH_SIZE = 16;
+const ANALYZE_BATCH_MS = 200;
+
 async function analyzeAll() {
   if (!state.samples.length) { status('Nejdříve načti složku se sampley.', 'error'); return; }
-  const btn = document.getElementById('btn-analyze');
+  const btn = $id('btn-analyze');
   btn.disabled = true;
-  btn.textContent = '⏳ Analyzuji…';
+  btn.textContent = LABELS.analyzeBusy;
+
+  const indexByPath = new Map(state.samples.map((s, i) => [s.file_path, i]));
+  let pending = [];
+  let flushTimer = null;
+  const flushResults = () => {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+    if (!pending.length) return;
+    const changed = [];
+    pending.forEach(r => {
+      const i = indexByPath.get(r.file_path);
+      if (i !== undefined && state.samples[i]?.file_path === r.file_path) {
+        state.samples[i] = r;
+        changed.push(i);
+      }
+    });
+    pending = [];
+    refreshSampleRows(changed);
+  };
 
   try {
     status(`Analyzuji ${state.samples.length} souborů (CREPE pitch + RMS velocity)…`);
-    const data = await api('POST', '/analyze/batch', {
-      file_paths: state.samples.map(s => s.file_path),
-      session_name: state.session,
+    const data = await new Promise((resolve, reject) => {
+      const ws = new WebSocket(API.replace(/^http/, 'ws') + '/analyze/batch/ws');
+      ws.onopen = () => ws.send(JSON.stringify({
+        file_paths: state.samples.map(s => s.file_path),
+        session_name: state.session,
+      }));
+      ws.onmessage = e => {
+        const msg = JSON.parse(e.data);
+        if (msg.type === 'progress') {
+          status(`Analyzuji ${msg.current}/${msg.total}: ${msg.filename}`);
+        } else if (msg.type === 'result') {
+          const { type, from_cache, ...result } = msg;
+          pending.push(result);
+          if (pending.length >= ANALYZE_BATCH_SIZE) flushResults();
+          else if (flushTimer === null) flushTimer = setTimeout(flushResults, ANALYZE_BATCH_MS);
+        } else if (msg.type === 'done') {
+          resolve(msg);
+          ws.close();
+        } else if (msg.type === 'error') {
+          reject(new Error(msg.message));
+          ws.close();
+        }
+      };
+      // Po resolve/reject už nemá další reject žádný efekt
+      ws.onerror = () => reject(new Error('WebSocket spojení selhalo.'));
+      ws.onclose = () => reject(new Error('Spojení se serverem bylo ukončeno.'));
     });
 
-    // Aktualizovat state.samples výsledky analýzy
-    const byPath = {};
-    data.results.forEach(r => { byPath[r.file_path] = r; });
-    state.samples = state.samples.map(s => byPath[s.file_path] || s);
-
-    renderSampleList();
+    flushResults();
     status(`Analýza dokončena: ${data.successful} OK, ${data.failed} selhalo, ${data.from_cache} z cache.`, 'ok');
   } catch (e) {
+    flushResults();
     status('Chyba analýzy: ' + e.message, 'error');
   } finally {
     btn.disabled = false;
-    btn.textContent = '🔍 Analyzovat';
+    btn.textContent = LABELS.analyze;
   }
 }
 
@@ -247,74 +328,140 @@ function autoAssign() {
   });
 
   state.mapping = newMapping;
+  state.mappedCount = Object.keys(newMapping).length;
   renderMatrix();
-  document.getElementById('btn-auto').disabled = false;
-  status(`Auto-assign dokončen: ${Object.keys(newMapping).length} buněk přiřazeno.`, 'ok');
+  $id('btn-auto').disabled = false;
+  status(`Auto-assign dokončen: ${state.mappedCount} buněk přiřazeno.`, 'ok');
 }
 
 // ── Sample list ───────────────────────────────────────────
 function renderSampleList() {
-  const el = document.getElementById('sample-list');
-  document.getElementById('sample-count').textContent = state.samples.length;
-  document.getElementById('btn-auto').disabled = state.samples.length === 0;
-
-  el.innerHTML = '';
-  state.samples.forEach((s, idx) => {
-    const div = document.createElement('div');
-    div.className = 'sample-item';
-    div.draggable = true;
-    div.dataset.idx = idx;
-
-    const name = document.createElement('div');
-    name.className = 'sample-name';
-    name.textContent = s.filename;
-
-    const meta = document.createElement('div');
-    meta.className = 'sample-meta';
-
-    if (s.detected_midi != null) {
-      const badge = document.createElement('span');
-      badge.className = 'midi-badge';
-      badge.textContent = midiToName(s.detected_midi) + ' (' + s.detected_midi + ')';
-      meta.appendChild(badge);
-    } else if (s.analyzed === false) {
-      const badge = document.createElement('span');
-      badge.style.cssText = 'color:#555; font-size:10px;';
-      badge.textContent = 'neanalyzováno';
-      meta.appendChild(badge);
+  const el = $id('sample-list');
+  $id('sample-count').textContent = state.samples.length;
+  $id('btn-auto').disabled = state.samples.length === 0;
+
+  // Existující řádky se znovu použijí (jen se přepíše obsah), nové se
+  // skládají mimo DOM a vloží se najednou, přebytečné se odeberou
+  const rows = el.children;
+  const reused = Math.min(rows.length, state.samples.length);
+  for (let idx = 0; idx < reused; idx++) fillSampleRow(rows[idx], state.samples[idx], idx);
+  while (rows.length > state.samples.length) rows[rows.length - 1].remove();
+
+  if (state.samples.length > reused) {
+    const frag = document.createDocumentFragment();
+    for (let idx = reused; idx < state.samples.length; idx++) {
+      frag.appendChild(fillSampleRow(createSampleRow(), state.samples[idx], idx));
     }
+    el.appendChild(frag);
+  }
+}
 
-    if (s.velocity_amplitude != null) {
-      const vel = document.createElement('span');
-      vel.className = 'vel-badge';
-      vel.textContent = 'vel: ' + s.velocity_amplitude.toFixed(3);
-      meta.appendChild(vel);
-    }
+// Přepíše jen řádky na daných indexech — bez průchodu celým seznamem
+function refreshSampleRows(indices) {
+  const rows = $id('sample-list').children;
+  if (rows.length !== state.samples.length) { renderSampleList(); return; }
+  indices.forEach(idx => fillSampleRow(rows[idx], state.samples[idx], idx));
+}
 
-    div.appendChild(name);
-    div.appendChild(meta);
+function createSampleRow() {
+  const div = document.createElement('div');
+  div.className = 'sample-item';
+  div.draggable = true;
 
-    // Drag events
-    div.addEventListener('dragstart', e => {
-      state.dragSample = s;
-      div.classList.add('dragging');
-      e.dataTransfer.effectAllowed = 'copy';
-    });
-    div.addEventListener('dragend', () => div.classList.remove('dragging'));
+  const name = document.createElement('div');
+  name.className = 'sample-name';
+  const meta = document.createElement('div');
+  meta.className = 'sample-meta';
+
+  div.appendChild(name);
+  div.appendChild(meta);
+  return div;
+}
+
+function fillSampleRow(div, s, idx) {
+  if (div.dataset.idx !== String(idx)) div.dataset.idx = idx;
 
-    // Klik = přehraj
-    div.addEventListener('click', () => playSample(s));
+  // Podpis zobrazovaných hodnot — nezměněný řádek se nepřepisuje
+  const sig = `${s.filename}|${s.detected_midi}|${s.analyzed}|${s.velocity_amplitude}`;
+  if (div._sig === sig) return div;
+  div._sig = sig;
 
-    el.appendChild(div);
+  div.firstChild.textContent = s.filename;
+
+  const badges = [];
+  if (s.detected_midi != null) {
+    badges.push(makeBadge('midi-badge', midiLabel(s.detected_midi)));
+  } else if (s.analyzed === false) {
+    badges.push(makeBadge('pending-badge', LABELS.notAnalyzed));
+  }
+  if (s.velocity_amplitude != null) {
+    badges.push(makeBadge('vel-badge', 'vel: ' + s.velocity_amplitude.toFixed(3)));
+  }
+  div.lastChild.replaceChildren(...badges);
+  return div;
+}
+
+function makeBadge(className, text) {
+  const badge = document.createElement('span');
+  badge.className = className;
+  badge.textContent = text;
+  return badge;
+}
+
+// Jedna sada listenerů na kontejneru místo tří closures na každý řádek
+function initSampleList() {
+  const el = $id('sample-list');
+  const itemOf = e => e.target.closest('.sample-item');
+
+  el.addEventListener('dragstart', e => {
+    const div = itemOf(e);
+    if (!div) return;
+    state.dragSample = state.samples[div.dataset.idx];
+    div.classList.add('dragging');
+    e.dataTransfer.effectAllowed = 'copy';
+    if (e.dataTransfer.setDragImage && state.dragSample) {
+      e.dataTransfer.setDragImage(dragGhost(state.dragSample.filename), 8, 8);
+    }
+  });
+  el.addEventListener('dragend', e => {
+    const div = itemOf(e);
+    if (div) div.classList.remove('dragging');
   });
+
+  // Klik = přehraj
+  el.addEventListener('click', e => {
+    const div = itemOf(e);
+    if (div) playSample(state.samples[div.dataset.idx]);
+  });
+}
+
+// Malý sdílený drag obrázek místo snímku celého řádku — vytvoří se jednou
+// a při dalších taženích se mu jen přepíše text
+let _dragGhost = null;
+function dragGhost(text) {
+  if (!_dragGhost) {
+    _dragGhost = document.createElement('div');
+    _dragGhost.className = 'drag-ghost';
+    document.body.appendChild(_dragGhost);
+  }
+  _dragGhost.textContent = text;
+  return _dragGhost;
 }
 
 // ── VU Meter (Web Audio API) ──────────────────────────────
 const VU = (() => {
   let ctx = null, analyser = null, source = null, rafId = null;
+  let canvas = null, c = null, buf = null;   // sdíleno všemi snímky
   const BARS = 20;
   const BAR_GAP = 2;
 
+  // Barvy sloupců (zelená → jantarová → červená) předpočítané pro rozsvícený/zhasnutý stav
+  const zone = i => (i < BARS * 0.6 ? 0 : i < BARS * 0.85 ? 1 : 2);
+  const ON_COLORS  = ['#00e060', '#ffb000', '#ff2020'];
+  const OFF_COLORS = ['#0a2818', '#2a1c00', '#2a0808'];
+  const BAR_ON  = Array.from({ length: BARS }, (_, i) => ON_COLORS[zone(i)]);
+  const BAR_OFF = Array.from({ length: BARS }, (_, i) => OFF_COLORS[zone(i)]);
+
   function init(audioEl) {
     if (ctx) return;
     ctx = new (window.AudioContext || window.webkitAudioContext)();
@@ -324,55 +471,64 @@ const VU = (() => {
     source = ctx.createMediaElementSource(audioEl);
     source.connect(analyser);
     analyser.connect(ctx.destination);
-  }
-
-  function draw() {
-    const canvas = document.getElementById('vu-meter');
-    const c = canvas.getContext('2d');
-    const W = canvas.width, H = canvas.height;
-    rafId = requestAnimationFrame(draw);
 
-    const buf = new Uint8Array(analyser.frequencyBinCount);
-    analyser.getByteFrequencyData(buf);
-    const rms = Math.sqrt(buf.reduce((s, v) => s + v * v, 0) / buf.length) / 255;
+    canvas = $id('vu-meter');
+    c = canvas.getContext('2d');
+    buf = new Uint8Array(analyser.frequencyBinCount);
+  }
 
-    c.clearRect(0, 0, W, H);
+  // Předkreslené vrstvy: pozadí se zhasnutými sloupci a rozsvícené sloupce se září.
+  // Každý snímek pak jen zkopíruje výřez — žádné shadowBlur na 20 sloupců.
+  let offLayer = null, onLayer = null, barW = 0;
+
+  function buildLayers(W, H) {
+    const make = () => {
+      const cv = document.createElement('canvas');
+      cv.width = W; cv.height = H;
+      return cv;
+    };
+    offLayer = make();
+    onLayer = make();
+    const off = offLayer.getContext('2d');
+    const on = onLayer.getContext('2d');
+    barW = (W - 2 - (BARS - 1) * BAR_GAP) / BARS;
 
     // Background track
-    c.fillStyle = '#0d1a30';
-    c.fillRect(0, 0, W, H);
-
-    const totalW = W - 2;
-    const barW = (totalW - (BARS - 1) * BAR_GAP) / BARS;
-    const lit = Math.round(rms * BARS);
+    off.fillStyle = '#0d1a30';
+    off.fillRect(0, 0, W, H);
 
     for (let i = 0; i < BARS; i++) {
       const x = 1 + i * (barW + BAR_GAP);
-      // Color: green → amber → red
-      let color;
-      if (i < BARS * 0.6)       color = i < lit ? '#00e060' : '#0a2818';
-      else if (i < BARS * 0.85) color = i < lit ? '#ffb000' : '#2a1c00';
-      else                       color = i < lit ? '#ff2020' : '#2a0808';
-
-      // LED glow on lit bars
-      if (i < lit) {
-        c.shadowBlur = 4;
-        c.shadowColor = color;
-      } else {
-        c.shadowBlur = 0;
-      }
+      off.fillStyle = BAR_OFF[i];
+      off.fillRect(x, 3, barW, H - 6);
+
+      // LED glow + top highlight
+      on.shadowBlur = 4;
+      on.shadowColor = BAR_ON[i];
+      on.fillStyle = BAR_ON[i];
+      on.fillRect(x, 3, barW, H - 6);
+      on.fillStyle = 'rgba(255,255,255,0.15)';
+      on.fillRect(x, 3, barW, 2);
+    }
+  }
 
-      // Draw bar with slight bevel
-      c.fillStyle = color;
-      c.fillRect(x, 3, barW, H - 6);
+  function draw() {
+    const W = canvas.width, H = canvas.height;
+    rafId = requestAnimationFrame(draw);
+    if (!offLayer || offLayer.width !== W || offLayer.height !== H) buildLayers(W, H);
 
-      // Top highlight
-      if (i < lit) {
-        c.fillStyle = 'rgba(255,255,255,0.15)';
-        c.fillRect(x, 3, barW, 2);
-      }
+    analyser.getByteFrequencyData(buf);
+    let sum = 0;
+    for (let i = 0; i < buf.length; i++) sum += buf[i] * buf[i];
+    const rms = Math.sqrt(sum / buf.length) / 255;
+
+    const lit = Math.round(rms * BARS);
+    c.clearRect(0, 0, W, H);
+    c.drawImage(offLayer, 0, 0);
+    if (lit > 0) {
+      const litW = Math.min(W, 1 + lit * (barW + BAR_GAP));
+      c.drawImage(onLayer, 0, 0, litW, H, 0, 0, litW, H);
     }
-    c.shadowBlur = 0;
 
     // Peak hold indicator
     VU._peak = Math.max(VU._peak * 0.992, rms);
@@ -398,25 +554,51 @@ const VU = (() => {
 })();
 
 // ── Přehrávání ────────────────────────────────────────────
+// Opakovaný klik na stejný sample jen přetočí na začátek — bez nového
+// stažení souboru a přestavby dekodéru při rychlém proklikávání
+let _playerPath = null;
+
 function playSample(s) {
-  const audio = document.getElementById('audio-elem');
-  const label = document.getElementById('now-playing');
-  audio.src = `${API}/audio/file?file_path=${encodeURIComponent(s.file_path)}`;
-  label.textContent = s.filename;
+  const audio = $id('audio-elem');
+  if (s.file_path === _playerPath) {
+    audio.currentTime = 0;
+  } else {
+    _playerPath = s.file_path;
+    audio.src = `${API}/audio/file?file_path=${encodeURIComponent(s.file_path)}`;
+    $id('now-playing').textContent = s.filename;
+  }
   audio.play().catch(() => {});
   VU.start(audio);
-  audio.onended = () => { VU._peak = 0; };
+}
+
+// Listener na konec přehrávání se váže jednou, ne při každém playSample()
+function initPlayer() {
+  $id('audio-elem').addEventListener('ended', () => { VU._peak = 0; });
 }
 
 // ── Mapping matrix ────────────────────────────────────────
+// Šipky number inputu posílají change na každé kliknutí — série kliknutí
+// se slije do jednoho překreslení matice po uklidnění
+const REBUILD_DEBOUNCE_MS = 100;
+let _rebuildTimer = null;
+
 function rebuildMatrix() {
-  state.velLayers = parseInt(document.getElementById('vel-layers').value) || 8;
+  const layers = parseInt($id('vel-layers').value) || 8;
+  if (layers === state.velLayers && _rebuildTimer === null) return;
+  state.velLayers = layers;
+  clearTimeout(_rebuildTimer);
+  _rebuildTimer = setTimeout(_flushMatrixRebuild, REBUILD_DEBOUNCE_MS);
+}
+
+function _flushMatrixRebuild() {
+  _rebuildTimer = null;
   renderMatrix();
 }
 
 function renderMatrix() {
-  const container = document.getElementById('matrix-container');
-  container.innerHTML = '';
+  const container = $id('matrix-container');
+  // Celá matice se staví mimo DOM a vloží jedním replaceChildren
+  const frag = document.createDocumentFragment();
 
   // Hlavička velocity vrstev
   const header = document.createElement('div');
@@ -427,7 +609,7 @@ function renderMatrix() {
     th.textContent = `vel ${v}`;
     header.appendChild(th);
   }
-  container.appendChild(header);
+  frag.appendChild(header);
 
   // Řádky: MIDI noty od 108 (C8) dolů do 21 (A0)
   for (let midi = 108; midi >= 21; midi--) {
@@ -436,14 +618,15 @@ function renderMatrix() {
 
     const label = document.createElement('div');
     label.className = 'note-label' + (midi % 12 === 0 ? ' c-note' : '');
-    label.textContent = midiToName(midi) + ' (' + midi + ')';
+    label.textContent = midiLabel(midi);
     row.appendChild(label);
 
     for (let v = 0; v < state.velLayers; v++) {
       row.appendChild(makeCell(midi, v));
     }
-    container.appendChild(row);
+    frag.appendChild(row);
   }
+  container.replaceChildren(frag);
 }
 
 function makeCell(midi, vel) {
@@ -453,59 +636,109 @@ function makeCell(midi, vel) {
   cell.dataset.vel = vel;
 
   const key = `${midi}_${vel}`;
+  cell._key = key;   // klíč mapování uložený při stavbě — handlery ho jen čtou
   if (state.mapping[key]) {
     setCellFilled(cell, state.mapping[key]);
   }
+  return cell;
+}
 
-  // Drag-over
-  cell.addEventListener('dragover', e => {
+function cellKey(cell) {
+  return cell._key;
+}
+
+// Listenery jsou jen na kontejneru — buňky (88 × vrstvy) žádné nemají
+function initMatrix() {
+  const container = $id('matrix-container');
+  const cellOf = e => e.target.closest('.matrix-cell');
+
+  // dragover chodí desítkykrát za sekundu — třídy se mění jen při změně buňky
+  let overCell = null;
+  const setOverCell = cell => {
+    if (cell === overCell) return;
+    if (overCell) overCell.classList.remove('drag-over');
+    overCell = cell;
+    if (cell) cell.classList.add('drag-over');
+  };
+
+  // Drag-over — kurzor zůstává nad stejným elementem většinu událostí,
+  // closest() se proto volá jen při změně e.target
+  let overTarget = null, overTargetCell = null;
+  container.addEventListener('dragover', e => {
+    if (e.target !== overTarget) {
+      overTarget = e.target;
+      overTargetCell = cellOf(e);
+    }
+    const cell = overTargetCell;
+    // Nad popiskem/hlavičkou/mezerou zhasne zvýraznění poslední buňky
+    setOverCell(cell);
+    if (!cell) return;
     e.preventDefault();
     e.dataTransfer.dropEffect = 'copy';
-    cell.classList.add('drag-over');
   });
-  cell.addEventListener('dragleave', () => cell.classList.remove('drag-over'));
-  cell.addEventListener('drop', e => {
+  container.addEventListener('dragleave', e => {
+    if (!container.contains(e.relatedTarget)) setOverCell(null);
+  });
+  container.addEventListener('drop', e => {
+    const cell = cellOf(e);
+    if (!cell) return;
     e.preventDefault();
-    cell.classList.remove('drag-over');
+    setOverCell(null);
     if (state.dragSample) {
+      const key = cellKey(cell);
+      if (!(key in state.mapping)) state.mappedCount++;
       state.mapping[key] = state.dragSample;
       setCellFilled(cell, state.dragSample);
       state.dragSample = null;
     }
   });
 
-  // Klik = přehraj
-  cell.addEventListener('click', e => {
-    if (e.target.classList.contains('cell-remove')) return;
-    if (state.mapping[key]) playSample(state.mapping[key]);
+  // Klik = přehraj, klik na ✕ = odeber
+  container.addEventListener('click', e => {
+    const cell = cellOf(e);
+    if (!cell) return;
+    if (e.target.classList.contains('cell-remove')) {
+      removeMapping(cell);
+      return;
+    }
+    const sample = state.mapping[cellKey(cell)];
+    if (sample) playSample(sample);
   });
-
-  return cell;
 }
 
+// Obsah obsazené buňky se klonuje z jedné předpřipravené šablony —
+// žádné parsování HTML řetězce pro každou buňku
+const CELL_FILLED_TEMPLATE = (() => {
+  const frag = document.createDocumentFragment();
+  const name = document.createElement('span');
+  name.className = 'cell-name';
+  const remove = document.createElement('span');
+  remove.className = 'cell-remove';
+  remove.title = 'Odebrat';
+  remove.textContent = '✕';
+  frag.append(name, remove);
+  return frag;
+})();
+
 function setCellFilled(cell, sample) {
   cell.classList.add('filled');
-  const esc = escHtml(sample.filename);
-  cell.innerHTML = `
-    <span class="cell-name" title="${esc}">${esc}</span>
-    <span class="cell-remove" title="Odebrat" onclick="removeMapping(${cell.dataset.midi},${cell.dataset.vel},this)">✕</span>
-  `;
+  const content = CELL_FILLED_TEMPLATE.cloneNode(true);
+  const name = content.firstChild;
+  name.textContent = name.title = sample.filename;
+  cell.replaceChildren(content);
 }
 
-function removeMapping(midi, vel, btn) {
-  const key = `${midi}_${vel}`;
+function removeMapping(cell) {
+  const key = cellKey(cell);
+  if (key in state.mapping) state.mappedCount--;
   delete state.mapping[key];
-  const cell = btn.closest('.matrix-cell');
   cell.classList.remove('filled');
-  cell.innerHTML = '';
-  // Znovu přidat drag listenery
-  const newCell = makeCell(parseInt(midi), parseInt(vel));
-  cell.parentNode.replaceChild(newCell, cell);
+  cell.replaceChildren();
 }
 
 // ── Export ────────────────────────────────────────────────
 function openExportModal() {
-  if (!Object.keys(state.mapping).length) {
+  if (!state.mappedCount) {
     status('Nejdříve přiřaď sampley do matice.', 'error'); return;
   }
   openModal('modal-export');
@@ -520,15 +753,15 @@ function buildExportMapping() {
 
 async function runExport() {
   closeModal('modal-export');
-  const btn = document.getElementById('btn-export');
+  const btn = $id('btn-export');
   btn.disabled = true;
-  btn.textContent = '⏳ Exportuji…';
+  btn.textContent = LABELS.exportBusy;
   try {
     status('Exportuji sampley…');
     const result = await api('POST', '/export', {
       session_name: state.session,
       mapping: buildExportMapping(),
-      include_instrument_definition: document.getElementById('export-def').checked,
+      include_instrument_definition: $id('export-def').checked,
     });
     status(
       `Export dokončen: ${result.exported_count} souborů, ${result.failed_count} chyb.`,
@@ -539,15 +772,16 @@ async function runExport() {
     status('Chyba exportu: ' + e.message, 'error');
   } finally {
     btn.disabled = false;
-    btn.textContent = '⬇ Export Ithaca';
+    btn.textContent = LABELS.export;
   }
 }
 
 async function showDownloadModal() {
   try {
     const data = await fetch(`${API}/files/${encodeURIComponent(state.session)}/export`).then(r => r.json());
-    const list = document.getElementById('download-file-list');
-    list.innerHTML = '';
+    // Export může mít přes tisíc souborů — řádky se skládají mimo DOM
+    // a vloží se jedním replaceChildren
+    const frag = document.createDocumentFragment();
     data.files.forEach(f => {
       const row = document.createElement('div');
       row.className = 'download-file-row';
@@ -569,8 +803,9 @@ async function showDownloadModal() {
       row.appendChild(fname);
       row.appendChild(fsize);
       row.appendChild(link);
-      list.appendChild(row);
+      frag.appendChild(row);
     });
+    $id('download-file-list').replaceChildren(frag);
     openModal('modal-download');
   } catch (e) {
     status('Nepodařilo se načíst seznam exportů: ' + e.message, 'error');
@@ -587,23 +822,23 @@ async function previewExport() {
     const items = await api('POST', '/export/preview', {
       session_name: state.session,
       mapping: buildExportMapping(),
-      include_instrument_definition: document.getElementById('export-def').checked,
+      include_instrument_definition: $id('export-def').checked,
     });
     const valid = items.filter(i => i.valid).length;
-    alert(`Náhled exportu:\n${items.length} souborů celkem (${valid} platných)\n\nPrvní soubor: ${items[0]?.output_file || '—'}`);
-    status(`Náhled: ${items.length} souborů připraveno.`, 'ok');
+    // Bez alert() — modální dialog blokuje event loop (log stream, přehrávač)
+    status(`Náhled: ${items.length} souborů (${valid} platných), první: ${items[0]?.output_file || '—'}`, 'ok');
   } catch (e) {
     status('Chyba náhledu: ' + e.message, 'error');
   }
 }
 
 async function runExportSf2() {
-  if (!Object.keys(state.mapping).length) {
+  if (!state.mappedCount) {
     status('Nejdříve přiřaď sampley do matice.', 'error'); return;
   }
-  const btn = document.getElementById('btn-export-sf2');
+  const btn = $id('btn-export-sf2');
   btn.disabled = true;
-  btn.textContent = '⏳ Generuji SF2…';
+  btn.textContent = LABELS.sf2Busy;
   try {
     status('Generuji SF2 soubor…');
     const resp = await fetch(`${API}/export/sf2`, {
@@ -631,7 +866,7 @@ async function runExportSf2() {
     status('Chyba SF2 exportu: ' + e.message, 'error');
   } finally {
     btn.disabled = false;
-    btn.textContent = '⬇ Export SF2';
+    btn.textContent = LABELS.sf2;
   }
 }
 
@@ -639,6 +874,10 @@ async function runExportSf2() {
 let _logEs = null;
 let _logCount = 0;
 let _logHasError = false;
+const LOG_MAX_LINES = 300;
+let _logPending = [];     // řádky čekající na další snímek
+let _logPendingError = false;
+let _logFlushScheduled = false;
 
 function initLogStream() {
   if (_logEs) { _logEs.close(); _logEs = null; }
@@ -652,41 +891,71 @@ function initLogStream() {
   // EventSource se automaticky reconnectuje při chybě — není třeba handler
 }
 
+// Řádky se sbírají a do DOM zapíšou jednou za snímek — burst logů = jeden reflow
 function _appendLogLine(time, level, msg) {
-  const body = document.getElementById('log-body');
-  const line = document.createElement('div');
-  line.className = `log-line ${level}`;
-  line.textContent = `${time} [${level.padEnd(8)}] ${msg}`;
-  body.appendChild(line);
+  _logPending.push({ time, level, msg });
+  if (_logPending.length > LOG_MAX_LINES) _logPending.shift();
+  _logCount++;
+  if (level === 'ERROR' || level === 'CRITICAL') _logPendingError = true;
+  if (!_logFlushScheduled) {
+    _logFlushScheduled = true;
+    requestAnimationFrame(_flushLogLines);
+  }
+}
+
+function _flushLogLines() {
+  _logFlushScheduled = false;
+  const panel = $id('log-panel');
+
+  // Sbalený panel: aktualizuje se jen badge, řádky počkají na rozbalení
+  // (chyba panel rozbalí, takže se zapíše hned)
+  if (panel.classList.contains('collapsed') && !_logPendingError) {
+    $id('log-badge').textContent = _logCount > 999 ? '999+' : _logCount;
+    return;
+  }
+
+  const pending = _logPending;
+  _logPending = [];
+
+  const body = $id('log-body');
+  const frag = document.createDocumentFragment();
+  pending.forEach(({ time, level, msg }) => {
+    const line = document.createElement('div');
+    line.className = `log-line ${level}`;
+    line.textContent = `${time} [${level.padEnd(8)}] ${msg}`;
+    frag.appendChild(line);
+  });
+  body.appendChild(frag);
 
   // Max 300 řádků
-  while (body.children.length > 300) body.removeChild(body.firstChild);
+  while (body.children.length > LOG_MAX_LINES) body.removeChild(body.firstChild);
   body.scrollTop = body.scrollHeight;
 
-  _logCount++;
-  const badge = document.getElementById('log-badge');
+  const badge = $id('log-badge');
   badge.textContent = _logCount > 999 ? '999+' : _logCount;
 
-  if (level === 'ERROR' || level === 'CRITICAL') {
-    if (!_logHasError) {
-      _logHasError = true;
-      badge.classList.add('has-error');
-      // Rozbal panel při první chybě
-      document.getElementById('log-panel').classList.remove('collapsed');
-    }
+  if (_logPendingError && !_logHasError) {
+    _logHasError = true;
+    badge.classList.add('has-error');
+    // Rozbal panel při první chybě
+    panel.classList.remove('collapsed');
   }
+  _logPendingError = false;
 }
 
 function toggleLog() {
-  document.getElementById('log-panel').classList.toggle('collapsed');
+  const collapsed = $id('log-panel').classList.toggle('collapsed');
+  if (!collapsed && _logPending.length) _flushLogLines();
 }
 
 function clearLog(e) {
   e.stopPropagation();
-  document.getElementById('log-body').innerHTML = '';
+  $id('log-body').innerHTML = '';
+  _logPending = [];
+  _logPendingError = false;
   _logCount = 0;
   _logHasError = false;
-  const badge = document.getElementById('log-badge');
+  const badge = $id('log-badge');
   badge.textContent = '0';
   badge.classList.remove('has-error');
 }
@@ -694,6 +963,9 @@ function clearLog(e) {
 // ── Init ──────────────────────────────────────────────────
 (async function init() {
   initUploadDropzone();
+  initSampleList();
+  initMatrix();
+  initPlayer();
   initLogStream();
   await loadSessionList();
   status('API připojeno. Vytvoř nebo vyber session.');
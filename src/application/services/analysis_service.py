@@ -57,13 +57,12 @@ class AnalysisService:
             # 1. Načtení audio souboru
             audio_data = self.audio_loader.load(sample.filepath)
             if audio_data is None:
-                logger.error(f"Failed to load audio file: {sample.filepath}")
+                logger.error("Failed to load audio file: %s", sample.filepath)
                 return False
 
             logger.debug(
-                f"Loaded audio: {sample.filename}, "
-                f"duration={audio_data.duration:.2f}s, "
-                f"sr={audio_data.sample_rate}Hz"
+                "Loaded audio: %s, duration=%.2fs, sr=%sHz",
+                sample.filename, audio_data.duration, audio_data.sample_rate
             )
 
             # 2. Pitch detection
@@ -72,12 +71,12 @@ class AnalysisService:
                 sample.detected_midi = pitch_result.detected_midi
                 sample.detected_frequency = pitch_result.detected_frequency
                 logger.debug(
-                    f"Pitch detected: MIDI={pitch_result.detected_midi}, "
-                    f"freq={pitch_result.detected_frequency:.1f}Hz, "
-                    f"confidence={pitch_result.confidence:.2f}"
+                    "Pitch detected: MIDI=%s, freq=%.1fHz, confidence=%.2f",
+                    pitch_result.detected_midi, pitch_result.detected_frequency,
+                    pitch_result.confidence
                 )
             else:
-                logger.warning(f"No pitch detected for {sample.filename}")
+                logger.warning("No pitch detected for %s", sample.filename)
                 return False
 
             # 3. Amplitude analysis
@@ -85,25 +84,24 @@ class AnalysisService:
             if amplitude_result.velocity_amplitude is not None:
                 sample.velocity_amplitude = amplitude_result.velocity_amplitude
                 logger.debug(
-                    f"Amplitude: velocity={amplitude_result.velocity_amplitude:.6f}, "
-                    f"velocity_db={amplitude_result.velocity_amplitude_db:.1f}dB"
+                    "Amplitude: velocity=%.6f, velocity_db=%.1fdB",
+                    amplitude_result.velocity_amplitude, amplitude_result.velocity_amplitude_db
                 )
             else:
-                logger.warning(f"Amplitude analysis failed for {sample.filename}")
+                logger.warning("Amplitude analysis failed for %s", sample.filename)
                 return False
 
             # 4. Označit jako analyzovaný
             sample.mark_as_analyzed()
             logger.info(
-                f"✓ Analyzed: {sample.filename} -> "
-                f"MIDI {sample.detected_midi}, "
-                f"velocity {sample.velocity_amplitude:.6f}"
+                "✓ Analyzed: %s -> MIDI %s, velocity %.6f",
+                sample.filename, sample.detected_midi, sample.velocity_amplitude
             )
 
             return True
 
         except Exception as e:
-            logger.error(f"Analysis failed for {sample.filepath}: {e}")
+            logger.error("Analysis failed for %s: %s", sample.filepath, e)
             return False
 
     def analyze_batch(
@@ -135,8 +133,8 @@ class AnalysisService:
                 progress_callback(i, total)
 
         logger.info(
-            f"Batch analysis complete: {successful} successful, "
-            f"{failed} failed out of {total}"
+            "Batch analysis complete: %d successful, %d failed out of %d",
+            successful, failed, total
         )
 
         return successful, failed
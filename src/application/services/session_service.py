@@ -18,6 +18,7 @@ class SessionService:
         self.cache = cache_manager or Md5CacheManager()
         self.current_session_name: Optional[str] = None
         self.current_session_data: Optional[Dict[str, Any]] = None
+        self._loaded_revision = None  # Verze session souboru odpovidajici current_session_data
         self._lock = threading.Lock()
         
     def create_session(self, name: str) -> bool:
@@ -27,18 +28,24 @@ class SessionService:
                 session_data = self.repository.create(name)
                 self.current_session_name = name
                 self.current_session_data = session_data
+                self._loaded_revision = self.repository.get_revision(name)
                 self.cache.clear()
             return True
         except ValueError:
             return False
 
     def load_session(self, name: str) -> bool:
-        """Nacte session."""
+        """Nacte session. Pokud je uz nactena a soubor se nezmenil, nic neparsuje."""
+        revision = self.repository.get_revision(name)
+        if revision is not None and name == self.current_session_name and revision == self._loaded_revision:
+            return True
+
         session_data = self.repository.load(name)
         if session_data:
             with self._lock:
                 self.current_session_name = name
                 self.current_session_data = session_data
+                self._loaded_revision = revision
                 self.cache.load_cache_from_dict(session_data.get("samples_cache", {}))
             return True
         return False
@@ -48,12 +55,12 @@ class SessionService:
         cached = []
         to_analyze = []
 
-        logger.info(f"analyze_with_cache: Processing {len(samples)} samples")
+        logger.info("analyze_with_cache: Processing %s samples", len(samples))
 
         for sample in samples:
             try:
                 if not sample.filepath.exists():
-                    logger.warning(f"Sample filepath does not exist: {sample.filepath}")
+                    logger.warning("Sample filepath does not exist: %s", sample.filepath)
                     continue
 
                 file_hash = self.cache.calculate_file_hash(sample.filepath)
@@ -62,16 +69,16 @@ class SessionService:
                 if cached_data:
                     self._restore_sample_from_cache(sample, cached_data, file_hash)
                     cached.append(sample)
-                    logger.debug(f"Loaded from cache: {sample.filename}")
+                    logger.debug("Loaded from cache: %s", sample.filename)
                 else:
                     sample._hash = file_hash
                     to_analyze.append(sample)
-                    logger.debug(f"To analyze: {sample.filename}")
+                    logger.debug("To analyze: %s", sample.filename)
             except Exception as e:
-                logger.error(f"Error processing {sample.filename}: {e}", exc_info=True)
+                logger.error("Error processing %s: %s", sample.filename, e, exc_info=True)
                 to_analyze.append(sample)
 
-        logger.info(f"analyze_with_cache result: {len(cached)} cached, {len(to_analyze)} to analyze")
+        logger.info("analyze_with_cache result: %s cached, %s to analyze", len(cached), len(to_analyze))
         return cached, to_analyze
         
     def cache_analyzed_samples(self, samples: List[SampleMetadata]):
@@ -84,7 +91,8 @@ class SessionService:
 
             if self.current_session_data:
                 self.current_session_data["samples_cache"] = self.cache.export_cache_to_dict()
-                self.repository.save(self.current_session_name, self.current_session_data)
+                if self.repository.save(self.current_session_name, self.current_session_data):
+                    self._loaded_revision = self.repository.get_revision(self.current_session_name)
             
     def _restore_sample_from_cache(self, sample, cached_data, file_hash):
         """Obnovi sample z cache."""
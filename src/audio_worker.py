@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from typing import Optional
 import numpy as np
 from config import AUDIO
+from .midi_utils import MidiUtils
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ try:
     AUDIO_AVAILABLE = True
 except ImportError as e:
     AUDIO_AVAILABLE = False
-    logger.warning(f"Audio libraries not available: {e}")
+    logger.warning("Audio libraries not available: %s", e)
 
 # MIDI knihovna (preferovaná pro playback)
 try:
@@ -88,12 +89,12 @@ class AudioWorker:
             if self.midi_available_ports:
                 # Zkus otevřít první dostupný port
                 self.midi_port = mido.open_output(self.midi_available_ports[0])
-                logger.info(f"✓ MIDI port opened: {self.midi_available_ports[0]}")
-                logger.info(f"  Available ports: {self.midi_available_ports}")
+                logger.info("✓ MIDI port opened: %s", self.midi_available_ports[0])
+                logger.info("  Available ports: %s", self.midi_available_ports)
             else:
                 logger.info("No MIDI ports available - will use audio tone fallback")
         except Exception as e:
-            logger.warning(f"Could not open MIDI port: {e} - will use audio tone fallback")
+            logger.warning("Could not open MIDI port: %s - will use audio tone fallback", e)
             self.midi_port = None
 
     def start(self):
@@ -120,13 +121,25 @@ class AudioWorker:
         logger.info("Stopping AudioWorker...")
         self.running = False
 
-        # Pošli shutdown command
+        # Nevyřízené tasky se zahodí - shutdown se tak zařadí bez čekání na místo ve frontě
+        while True:
+            try:
+                self.task_queue.get_nowait()
+            except queue.Empty:
+                break
         try:
-            self.task_queue.put(AudioTask(AudioCommand.SHUTDOWN, {}), timeout=AUDIO.Timing.THREAD_SHUTDOWN_TIMEOUT)
+            self.task_queue.put_nowait(AudioTask(AudioCommand.SHUTDOWN, {}))
         except queue.Full:
-            pass
+            pass  # Smyčka skončí i tak - kontroluje self.running
+
+        # Přeruš právě běžící blokující přehrávání, jinak by worker doběhl až na konci samplu
+        if self.is_playing and AUDIO_AVAILABLE:
+            try:
+                sd.stop()
+            except Exception:
+                pass
 
-        # Počkej na dokončení threadu
+        # Worker teď končí během milisekund - join je jen pojistka
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=AUDIO.Timing.THREAD_JOIN_TIMEOUT)
 
@@ -155,9 +168,9 @@ class AudioWorker:
         try:
             # Non-blocking put s timeoutem
             self.task_queue.put(task, timeout=AUDIO.Timing.QUEUE_TIMEOUT_SHORT)
-            logger.debug(f"MIDI tone {midi_note} queued for playback")
+            logger.debug("MIDI tone %s queued for playback", midi_note)
         except queue.Full:
-            logger.warning(f"Audio queue full, dropping MIDI tone {midi_note}")
+            logger.warning("Audio queue full, dropping MIDI tone %s", midi_note)
             if callback:
                 callback(success=False, error="Queue full")
 
@@ -183,9 +196,9 @@ class AudioWorker:
 
         try:
             self.task_queue.put(task, timeout=AUDIO.Timing.QUEUE_TIMEOUT_SHORT)
-            logger.debug(f"Sample {filepath} queued for playback")
+            logger.debug("Sample %s queued for playback", filepath)
         except queue.Full:
-            logger.warning(f"Audio queue full, dropping sample {filepath}")
+            logger.warning("Audio queue full, dropping sample %s", filepath)
             if callback:
                 callback(success=False, error="Queue full")
 
@@ -237,7 +250,7 @@ class AudioWorker:
             except queue.Empty:
                 continue
             except Exception as e:
-                logger.error(f"Error in worker loop: {e}", exc_info=True)
+                logger.error("Error in worker loop: %s", e, exc_info=True)
 
         # Cleanup při ukončení
         self._cleanup()
@@ -252,7 +265,7 @@ class AudioWorker:
                 self.auto_stop_event.set()
                 logger.debug("Playback stopped")
         except Exception as e:
-            logger.error(f"Error stopping playback: {e}")
+            logger.error("Error stopping playback: %s", e)
 
     def _handle_play_tone(self, task: AudioTask):
         """
@@ -278,7 +291,7 @@ class AudioWorker:
                 self._play_midi_via_port(midi_note, callback)
                 return
             except Exception as e:
-                logger.warning(f"MIDI port playback failed: {e}, falling back to audio tone")
+                logger.warning("MIDI port playback failed: %s, falling back to audio tone", e)
                 # Fallback na metodu 2
 
         # METODA 2: Audio tón přes sounddevice (fallback)
@@ -287,7 +300,7 @@ class AudioWorker:
                 self._play_audio_tone(midi_note, callback)
                 return
             except Exception as e:
-                logger.error(f"Audio tone playback failed: {e}", exc_info=True)
+                logger.error("Audio tone playback failed: %s", e, exc_info=True)
                 if callback:
                     callback(success=False, error=str(e))
         else:
@@ -306,7 +319,7 @@ class AudioWorker:
         self.midi_port.send(msg_on)
         self.is_playing = True
 
-        logger.debug(f"MIDI note_on: {midi_note}, velocity={velocity}")
+        logger.debug("MIDI note_on: %s, velocity=%s", midi_note, velocity)
 
         # Wait for duration
         time.sleep(duration)
@@ -316,23 +329,22 @@ class AudioWorker:
         self.midi_port.send(msg_off)
         self.is_playing = False
 
-        frequency = AUDIO.MIDI.A4_FREQUENCY * (2 ** ((midi_note - AUDIO.MIDI.A4_MIDI) / 12))
-        logger.info(f"✓ MIDI note {midi_note} ({frequency:.1f} Hz) played via MIDI port")
+        frequency = MidiUtils.midi_to_frequency(midi_note)
+        logger.info("✓ MIDI note %s (%.1f Hz) played via MIDI port", midi_note, frequency)
 
         if callback:
             callback(success=True, midi_note=midi_note, frequency=frequency, method="MIDI")
 
     def _play_audio_tone(self, midi_note: int, callback=None):
         """Přehraje audio tón přes sounddevice (fallback metoda)."""
-        # Zastaví předchozí přehrávání
+        # Zastaví předchozí přehrávání (sd.stop() je synchronní — bez čekání)
         if self.is_playing:
             sd.stop()
-            time.sleep(AUDIO.Timing.PLAYBACK_CLEANUP_DELAY)
 
         # Generuj tón
         sample_rate = AUDIO.Audio.DEFAULT_SAMPLE_RATE
         duration = AUDIO.Audio.MIDI_TONE_DURATION
-        frequency = AUDIO.MIDI.A4_FREQUENCY * (2 ** ((midi_note - AUDIO.MIDI.A4_MIDI) / 12))
+        frequency = MidiUtils.midi_to_frequency(midi_note)
 
         t = np.linspace(0, duration, int(sample_rate * duration))
         tone = np.sin(2 * np.pi * frequency * t)
@@ -350,7 +362,7 @@ class AudioWorker:
         sd.play(tone, sample_rate, blocking=True)
         self.is_playing = False
 
-        logger.info(f"✓ MIDI tone {midi_note} ({frequency:.1f} Hz) played via audio")
+        logger.info("✓ MIDI tone %s (%.1f Hz) played via audio", midi_note, frequency)
 
         if callback:
             callback(success=True, midi_note=midi_note, frequency=frequency, method="Audio")
@@ -361,34 +373,34 @@ class AudioWorker:
         callback = task.callback
 
         try:
-            # Zastaví předchozí přehrávání
+            # Zastaví předchozí přehrávání (sd.stop() je synchronní — bez čekání)
             if self.is_playing:
                 sd.stop()
-                time.sleep(AUDIO.Timing.WORKER_LOOP_SLEEP)
 
-            # Načti audio
-            audio_data, sample_rate = sf.read(str(filepath))
+            # Načti audio (float32 stačí pro přehrání a je poloviční proti float64)
+            audio_data, sample_rate = sf.read(str(filepath), dtype='float32')
 
             # Mono conversion
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
+            if audio_data.ndim > 1:
+                audio_data = audio_data.mean(axis=1, dtype=np.float32)
 
-            # Normalizace
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data)) * AUDIO.Audio.VOLUME_SAMPLE
+            # Normalizace - špička se počítá jednou, škálování proběhne na místě
+            peak = float(np.max(np.abs(audio_data))) if audio_data.size else 0.0
+            if peak > 0:
+                audio_data *= AUDIO.Audio.VOLUME_SAMPLE / peak
 
             # Přehraj (blocking v worker threadu je OK!)
             self.is_playing = True
             sd.play(audio_data, sample_rate, blocking=True)
             self.is_playing = False
 
-            logger.info(f"✓ Sample {filepath} played successfully")
+            logger.info("✓ Sample %s played successfully", filepath)
 
             if callback:
                 callback(success=True, filepath=filepath)
 
         except Exception as e:
-            logger.error(f"Error playing sample {filepath}: {e}", exc_info=True)
+            logger.error("Error playing sample %s: %s", filepath, e, exc_info=True)
             self.is_playing = False
             if callback:
                 callback(success=False, error=str(e))
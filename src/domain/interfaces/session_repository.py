@@ -3,7 +3,7 @@ Interface pro Session Repository - definuje kontrakt pro ukládání sessions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import Hashable, List, Optional, Dict, Any
 from pathlib import Path
 
 
@@ -88,3 +88,18 @@ class ISessionRepository(ABC):
             True pokud se podařilo smazat
         """
         pass
+
+    def get_revision(self, session_name: str) -> Optional[Hashable]:
+        """
+        Vrátí levně zjistitelný identifikátor aktuální verze uložené session.
+
+        Slouží k přeskočení opakovaného načítání nezměněné session.
+        Výchozí implementace verzi nezná (vrací None = vždy načíst znovu).
+
+        Args:
+            session_name: Název session
+
+        Returns:
+            Hashovatelná hodnota měnící se s obsahem, nebo None
+        """
+        return None
@@ -5,6 +5,16 @@ Domain model pro audio sample - čistá business logika bez závislostí
 from pathlib import Path
 from typing import Optional
 
+# Názvy not pro get_pitch_info (doménový model nesmí záviset na MidiUtils)
+_NOTE_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+# Předpřipravené šablony pro get_pitch_info / get_amplitude_info
+_FREQ_FMT = "({:.1f} Hz)".format
+_CONF_FMT = "(conf: {:.2f})".format
+_RMS_FMT = "RMS: {:.6f}".format
+_DB_FMT = "({:.1f} dB)".format
+_RMS_WINDOW_FMT = "(RMS {:.0f}ms)".format
+
 
 class SampleMetadata:
     """
@@ -85,30 +95,33 @@ class SampleMetadata:
 
     def get_pitch_info(self) -> str:
         """Vrátí formátovanou informaci o pitch - LEGACY metoda pro kompatibilitu."""
-        if not self.detected_midi:
+        if self.detected_midi is None:
             return "No pitch detected"
 
-        # Inline MIDI to note conversion (temporary)
-        notes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (self.detected_midi // 12) - 1
-        note = notes[self.detected_midi % 12]
-        note_name = f"{note}{octave}"
-
-        confidence_str = f" (conf: {self.pitch_confidence:.2f})" if self.pitch_confidence else ""
-        method_str = f" [{self.pitch_method}]" if self.pitch_method else ""
+        parts = [f"{_NOTE_NAMES[self.detected_midi % 12]}{(self.detected_midi // 12) - 1}"]
+        if self.detected_frequency is not None:
+            parts.append(_FREQ_FMT(self.detected_frequency))
+        if self.pitch_confidence is not None:
+            parts.append(_CONF_FMT(self.pitch_confidence))
+        if self.pitch_method:
+            parts.append(f"[{self.pitch_method}]")
 
-        return f"{note_name} ({self.detected_frequency:.1f} Hz){confidence_str}{method_str}"
+        return " ".join(parts)
 
     def get_amplitude_info(self) -> str:
         """Vrátí formátovanou informaci o amplitude - LEGACY metoda pro kompatibilitu."""
         if self.velocity_amplitude is None:
             return "No amplitude data"
 
-        db_str = f" ({self.velocity_amplitude_db:.1f} dB)" if self.velocity_amplitude_db is not None else ""
-        filtered_str = " [FILTERED]" if self.is_filtered else ""
-        duration_str = f" (RMS {self.velocity_duration_ms:.0f}ms)" if self.velocity_duration_ms else ""
+        parts = [_RMS_FMT(self.velocity_amplitude)]
+        if self.velocity_amplitude_db is not None:
+            parts.append(_DB_FMT(self.velocity_amplitude_db))
+        if self.velocity_duration_ms:
+            parts.append(_RMS_WINDOW_FMT(self.velocity_duration_ms))
+        if self.is_filtered:
+            parts.append("[FILTERED]")
 
-        return f"RMS: {self.velocity_amplitude:.6f}{db_str}{duration_str}{filtered_str}"
+        return " ".join(parts)
 
 
 class AnalysisProgress:
@@ -2,18 +2,64 @@
 export_utils.py - Utility funkce pro export samples se skutečnou sample rate konverzí
 """
 
+import os
 import shutil
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 import logging
 
+import numpy as np
+
 from config import EXPORT, AUDIO
 from .models import SampleMetadata
 from .midi_utils import MidiUtils
 
 logger = logging.getLogger(__name__)
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+    logger.warning("soundfile not available - export disabled")
+
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+    logger.warning("soxr not available - export disabled")
+
+
+# Recyklovaný buffer pro čtení bloků - jeden na vlákno, sdílený všemi ExportManager
+# instancemi, takže se nealokuje znovu s každým exportním requestem
+_scratch_local = threading.local()
+
+# Sdílený pool exportních vláken - vlákna přežívají mezi exporty, takže
+# s nimi přežívají i jejich _scratch_local buffery (vlákna vznikají líně)
+_EXPORT_POOL = ThreadPoolExecutor(max_workers=EXPORT.Batch.MAX_WORKERS,
+                                  thread_name_prefix="export")
+
+
+# Meze validace jako lokální konstanty modulu (bez řetězení atributů v hot path)
+_PIANO_MIN_MIDI = MidiUtils.PIANO_MIN_MIDI
+_PIANO_MAX_MIDI = MidiUtils.PIANO_MAX_MIDI
+_MIN_VELOCITY = EXPORT.Validation.MIN_VELOCITY
+_MAX_VELOCITY = EXPORT.Validation.MAX_VELOCITY
+
+
+class SampleCheck(Enum):
+    """Výsledek validace jednoho samplu před exportem (hodnota = důvod selhání)."""
+    OK = "OK"
+    NOT_METADATA = "Sample není SampleMetadata instance"
+    MISSING_FILE = "Zdrojový soubor neexistuje"
+    MIDI_OUT_OF_RANGE = "MIDI nota není v piano rozsahu"
+    VELOCITY_OUT_OF_RANGE = "Velocity není v povoleném rozsahu"
+
 
 class ExportManager:
     """Správce exportu namapovaných samples se sample rate konverzí."""
@@ -22,31 +68,39 @@ class ExportManager:
         self.output_folder = Path(output_folder)
         self.export_formats = EXPORT.Formats.FORMATS
 
-    def export_mapped_samples(self, mapping: Dict[Tuple[int, int], SampleMetadata]) -> Dict[str, Union[int, List[str], List[Tuple[str, str]]]]:
+    def export_mapped_samples(self, mapping: Dict[Tuple[int, int], SampleMetadata],
+                              strict: bool = False) -> Dict[str, Union[int, List[str], List[Tuple[str, str]]]]:
         """
         Exportuje všechny namapované samples se skutečnou sample rate konverzí.
 
+        Validace probíhá v jediném průchodu před exportem - nevalidní sample
+        se zapíše do failed_files s konkrétním důvodem a export pokračuje.
+        Validní samples se exportují paralelně ve sdíleném poolu
+        (EXPORT.Batch.MAX_WORKERS vláken).
+
         Args:
             mapping: Dictionary (midi_note, velocity) -> SampleMetadata
+            strict: Pokud True, celé mapování se nejdřív zvaliduje a při
+                    jakékoli chybě se export vůbec nespustí (ValueError)
 
         Returns:
             Dictionary s informacemi o exportu
         """
 
         # Kontrola dostupnosti knihoven pro sample rate konverzi
-        try:
-            import soundfile as sf
-            import librosa
-        except ImportError as e:
-            raise ValueError(EXPORT.Errors.MISSING_LIBRARIES.format(library=str(e)))
+        if not SOUNDFILE_AVAILABLE:
+            raise ValueError(EXPORT.Errors.MISSING_LIBRARIES.format(library="soundfile"))
+        if not SOXR_AVAILABLE:
+            raise ValueError(EXPORT.Errors.MISSING_LIBRARIES.format(library="soxr"))
 
         if not mapping:
             raise ValueError(EXPORT.Errors.NO_SAMPLES)
 
-        # Validace před exportem
-        validation_errors = ExportValidator.validate_mapping(mapping)
-        if validation_errors:
-            raise ValueError(f"Validační chyby: {'; '.join(validation_errors[:3])}")
+        # Volitelná předběžná validace celého mapování
+        if strict:
+            validation_errors = ExportValidator.validate_mapping(mapping)
+            if validation_errors:
+                raise ValueError(f"Validační chyby: {'; '.join(validation_errors[:3])}")
 
         # Vytvořit výstupní složku pokud neexistuje
         try:
@@ -62,63 +116,73 @@ class ExportManager:
             'total_files': 0
         }
 
-        # Exportuj každý sample
+        # Validace proběhne sekvenčně (je levná), zápis souborů pak paralelně -
+        # libsndfile i soxr uvolňují GIL a každý sample míří do vlastních souborů
+        jobs = []
         for key, sample in list(mapping.items()):
             if not isinstance(key, tuple) or len(key) != 2:
-                logger.error(f"Neplatný klíč v mapping: {key}")
+                logger.error("Neplatný klíč v mapping: %s", key)
                 export_info['failed_files'].append((str(key), "Neplatný formát klíče"))
                 export_info['failed_count'] += 1
                 continue
 
             midi_note, velocity = key
+            check = self._check_single_sample(sample, midi_note, velocity)
+            if check is not SampleCheck.OK:
+                export_info['failed_files'].append((getattr(sample, 'filename', str(sample)), check.value))
+                export_info['failed_count'] += 1
+                continue
 
-            try:
-                # Dodatečná validace sample
-                if not self._validate_single_sample(sample, midi_note, velocity):
-                    export_info['failed_files'].append((sample.filename, "Sample neprošel validací"))
-                    export_info['failed_count'] += 1
-                    continue
-
-                exported_files = self._export_single_sample(sample, midi_note, velocity)
-                export_info['exported_files'].extend(exported_files)
-                export_info['exported_count'] += 1
+            jobs.append((sample, midi_note, velocity))
 
-                logger.info(f"✓ Exportován: {sample.filename} -> MIDI {midi_note}, V{velocity}")
+        futures = [_EXPORT_POOL.submit(self._export_single_sample, *job) for job in jobs]
 
+        # Výsledky se sbírají v pořadí mapování
+        for (sample, midi_note, velocity), future in zip(jobs, futures):
+            try:
+                exported_files = future.result()
             except Exception as e:
-                logger.error(f"Chyba při exportu {sample.filename}: {e}")
+                logger.error("Chyba při exportu %s: %s", sample.filename, e)
                 export_info['failed_files'].append((sample.filename, str(e)))
                 export_info['failed_count'] += 1
+                continue
+
+            export_info['exported_files'].extend(exported_files)
+            export_info['exported_count'] += 1
+            logger.info("✓ Exportován: %s -> MIDI %s, V%s", sample.filename, midi_note, velocity)
 
         export_info['total_files'] = len(export_info['exported_files'])
 
-        logger.info(f"Export dokončen: {export_info['exported_count']} úspěšných, "
-                    f"{export_info['failed_count']} chybných")
+        logger.info("Export dokončen: %d úspěšných, %d chybných",
+                    export_info['exported_count'], export_info['failed_count'])
 
         return export_info
 
     def _validate_single_sample(self, sample: SampleMetadata, midi_note: int, velocity: int) -> bool:
         """Validuje jednotlivý sample před exportem."""
-        if not sample:
-            return False
+        return self._check_single_sample(sample, midi_note, velocity) is SampleCheck.OK
 
+    def _check_single_sample(self, sample: SampleMetadata, midi_note: int, velocity: int) -> SampleCheck:
+        """Validuje jednotlivý sample a vrátí konkrétní důvod případného selhání."""
         if not isinstance(sample, SampleMetadata):
-            logger.error(f"Sample není instance SampleMetadata: {type(sample)}")
-            return False
+            if sample:
+                logger.error("Sample není instance SampleMetadata: %s", type(sample))
+            return SampleCheck.NOT_METADATA
 
-        if not sample.filepath or not sample.filepath.exists():
-            logger.error(f"Soubor neexistuje: {sample.filepath}")
-            return False
+        filepath = sample.filepath
+        if not filepath or not filepath.exists():
+            logger.error("Soubor neexistuje: %s", filepath)
+            return SampleCheck.MISSING_FILE
 
-        if not MidiUtils.is_piano_range(midi_note):
-            logger.error(f"MIDI nota {midi_note} není v piano rozsahu")
-            return False
+        if not isinstance(midi_note, int) or not (_PIANO_MIN_MIDI <= midi_note <= _PIANO_MAX_MIDI):
+            logger.error("MIDI nota %s není v piano rozsahu", midi_note)
+            return SampleCheck.MIDI_OUT_OF_RANGE
 
-        if not (EXPORT.Validation.MIN_VELOCITY <= velocity <= EXPORT.Validation.MAX_VELOCITY):
-            logger.error(f"Velocity {velocity} není v rozsahu {EXPORT.Validation.MIN_VELOCITY}-{EXPORT.Validation.MAX_VELOCITY}")
-            return False
+        if not isinstance(velocity, int) or not (_MIN_VELOCITY <= velocity <= _MAX_VELOCITY):
+            logger.error("Velocity %s není v rozsahu %d-%d", velocity, _MIN_VELOCITY, _MAX_VELOCITY)
+            return SampleCheck.VELOCITY_OUT_OF_RANGE
 
-        return True
+        return SampleCheck.OK
 
     def _export_single_sample(self, sample: SampleMetadata, midi_note: int, velocity: int) -> List[Path]:
         """
@@ -129,28 +193,22 @@ class ExportManager:
             Seznam cest k exportovaným souborům
         """
         exported_files = []
+        src = os.fspath(sample.filepath)
 
         for sample_rate, sr_suffix in self.export_formats:
             try:
                 output_filename = MidiUtils.generate_filename(midi_note, velocity, sample_rate)
                 output_path = self.output_folder / output_filename
-
-                # Kontrola existence zdrojového souboru
-                if not sample.filepath.exists():
-                    raise FileNotFoundError(f"Zdrojový soubor neexistuje: {sample.filepath}")
+                dst = os.fspath(output_path)
 
                 # Pokud cílový soubor existuje, bude přepsán (podle zadání)
                 if output_path.exists():
-                    logger.debug(f"Přepisuji existující soubor: {output_filename}")
+                    logger.debug("Přepisuji existující soubor: %s", output_filename)
 
-                # NAČTI ORIGINÁLNÍ AUDIO
+                # ZJISTI SAMPLE RATE Z HLAVIČKY (bez dekódování celého souboru)
                 try:
-                    import soundfile as sf
-                    import librosa
-                    import numpy as np
-
-                    audio_data, original_sr = sf.read(str(sample.filepath))
-                    logger.debug(f"Načten {sample.filename}: {original_sr}Hz -> {sample_rate}Hz")
+                    original_sr = sf.info(src).samplerate
+                    logger.debug("Načten %s: %dHz -> %dHz", sample.filename, original_sr, sample_rate)
 
                 except Exception as e:
                     raise RuntimeError(f"Nelze načíst audio soubor {sample.filepath}: {e}")
@@ -159,40 +217,15 @@ class ExportManager:
                 if original_sr == sample_rate:
                     # Stejný sample rate - pouze kopíruj
                     try:
-                        shutil.copy2(sample.filepath, output_path)
-                        logger.debug(f"Zkopírován bez konverze: {output_filename}")
+                        shutil.copy2(src, dst)
+                        logger.debug("Zkopírován bez konverze: %s", output_filename)
                     except (OSError, IOError) as e:
                         raise RuntimeError(f"Chyba při kopírování souboru: {e}")
                 else:
                     # SKUTEČNÁ SAMPLE RATE KONVERZE
                     try:
-                        if len(audio_data.shape) > 1:
-                            # Stereo/Multi-channel - resample každý kanál samostatně
-                            resampled_channels = []
-                            for channel in range(audio_data.shape[1]):
-                                resampled_channel = librosa.resample(
-                                    audio_data[:, channel],
-                                    orig_sr=original_sr,
-                                    target_sr=sample_rate,
-                                    res_type=EXPORT.AudioParams.RESAMPLE_QUALITY
-                                )
-                                resampled_channels.append(resampled_channel)
-
-                            # Spojí kanály zpět
-                            resampled_audio = np.column_stack(resampled_channels)
-                        else:
-                            # Mono
-                            resampled_audio = librosa.resample(
-                                audio_data,
-                                orig_sr=original_sr,
-                                target_sr=sample_rate,
-                                res_type=EXPORT.AudioParams.RESAMPLE_QUALITY
-                            )
-
-                        # Ulož resamplovaný soubor
-                        sf.write(str(output_path), resampled_audio, sample_rate, subtype=EXPORT.AudioParams.SUBTYPE_PCM16)
-
-                        logger.debug(f"Konvertován {original_sr}Hz -> {sample_rate}Hz: {output_filename}")
+                        self._resample_stream(src, dst, sample_rate)
+                        logger.debug("Konvertován %dHz -> %dHz: %s", original_sr, sample_rate, output_filename)
 
                     except Exception as e:
                         raise RuntimeError(f"Chyba při sample rate konverzi: {e}")
@@ -207,19 +240,19 @@ class ExportManager:
 
                 # Volitelná verifikace sample rate (pokud soundfile dostupná)
                 try:
-                    _, verified_sr = sf.read(str(output_path), frames=1)
+                    verified_sr = sf.info(dst).samplerate
                     if verified_sr != sample_rate:
-                        logger.warning(f"Sample rate verification failed: expected {sample_rate}, got {verified_sr}")
-                except:
-                    pass  # Verifikace je volitelná
+                        logger.warning("Sample rate verification failed: expected %s, got %s", sample_rate, verified_sr)
+                except (OSError, RuntimeError):
+                    pass  # Verifikace je volitelná (sf.LibsndfileError je RuntimeError)
 
-                logger.info(f"✓ Exportován: {sample.filename} -> {output_filename} "
-                           f"({original_sr}Hz -> {sample_rate}Hz)")
+                logger.info("✓ Exportován: %s -> %s (%dHz -> %dHz)",
+                            sample.filename, output_filename, original_sr, sample_rate)
 
                 exported_files.append(output_path)
 
             except Exception as e:
-                logger.error(f"Export failed for {sr_suffix} ({sample_rate}Hz): {e}")
+                logger.error("Export failed for %s (%sHz): %s", sr_suffix, sample_rate, e)
                 # Pokračuj s dalšími formáty i při selhání jednoho
                 continue
 
@@ -228,6 +261,45 @@ class ExportManager:
 
         return exported_files
 
+    @staticmethod
+    def _get_scratch(frames: int, channels: int) -> np.ndarray:
+        """Vrátí (frames, channels) pohled do sdíleného float32 bufferu, který podle potřeby zvětší."""
+        needed = frames * channels
+        scratch = getattr(_scratch_local, 'buffer', None)
+        if scratch is None or scratch.size < needed:
+            scratch = _scratch_local.buffer = np.empty(needed, dtype=np.float32)
+        return scratch[:needed].reshape(frames, channels)
+
+    def _resample_stream(self, src: str, dst: str, target_sr: int) -> None:
+        """
+        Streamovaně převede sample rate po blocích - paměť je O(blok), ne O(soubor).
+
+        Args:
+            src: Cesta ke zdrojovému souboru
+            dst: Cesta k výstupnímu souboru (PCM 16)
+            target_sr: Cílová sample rate
+        """
+        block_size = EXPORT.AudioParams.STREAM_BLOCK_SIZE
+
+        with sf.SoundFile(src) as source:
+            channels = source.channels
+            resampler = soxr.ResampleStream(source.samplerate, target_sr, channels,
+                                            dtype='float32', quality=EXPORT.AudioParams.STREAM_QUALITY)
+
+            with sf.SoundFile(dst, mode='w', samplerate=target_sr, channels=channels,
+                              format=EXPORT.AudioParams.FORMAT_WAV,
+                              subtype=EXPORT.AudioParams.SUBTYPE_PCM16) as writer:
+                # Bloky se čtou do stále stejného bufferu - žádná alokace na blok
+                buffer = self._get_scratch(block_size, channels)
+                while True:
+                    block = source.read(out=buffer)
+                    if not len(block):
+                        break
+                    writer.write(resampler.resample_chunk(block, last=False))
+
+                # Vyprázdni zbytek v resampleru
+                writer.write(resampler.resample_chunk(np.empty((0, channels), dtype=np.float32), last=True))
+
     def validate_export_folder(self) -> bool:
         """Ověří, zda je výstupní složka dostupná pro zápis."""
         try:
@@ -241,7 +313,7 @@ class ExportManager:
             return True
 
         except Exception as e:
-            logger.error(f"Výstupní složka není dostupná pro zápis: {e}")
+            logger.error("Výstupní složka není dostupná pro zápis: %s", e)
             return False
 
     def get_export_preview(self, mapping: Dict[Tuple[int, int], SampleMetadata]) -> List[Dict]:
@@ -279,7 +351,7 @@ class ExportManager:
                         'valid': True
                     })
             except Exception as e:
-                logger.error(f"Chyba při vytváření preview pro {sample.filename}: {e}")
+                logger.error("Chyba při vytváření preview pro %s: %s", sample.filename, e)
                 preview.append({
                     'source_file': sample.filename,
                     'output_file': 'ERROR',
@@ -312,14 +384,14 @@ class ExportManager:
                     try:
                         file_path.unlink()
                         deleted_count += 1
-                        logger.debug(f"Smazán starý export: {file_path.name}")
+                        logger.debug("Smazán starý export: %s", file_path.name)
                     except Exception as e:
-                        logger.warning(f"Nelze smazat {file_path.name}: {e}")
+                        logger.warning("Nelze smazat %s: %s", file_path.name, e)
 
-            logger.info(f"Vyčištěno {deleted_count} starých exportů")
+            logger.info("Vyčištěno %d starých exportů", deleted_count)
 
         except Exception as e:
-            logger.error(f"Chyba při čištění starých exportů: {e}")
+            logger.error("Chyba při čištění starých exportů: %s", e)
 
         return deleted_count
 
@@ -371,17 +443,17 @@ class ExportManager:
             with open(json_path, 'w', encoding='utf-8') as f:
                 json.dump(instrument_definition, f, indent=4, ensure_ascii=False)
 
-            logger.info(f"✓ Instrument definition exported: {json_path}")
-            logger.info(f"  Instrument: {instrument_definition['instrumentName']}")
-            logger.info(f"  Author: {instrument_definition['author']}")
-            logger.info(f"  Category: {instrument_definition['category']}")
-            logger.info(f"  Version: {instrument_definition['instrumentVersion']}")
-            logger.info(f"  Sample Count: {instrument_definition['sampleCount']} MIDI notes")
+            logger.info("✓ Instrument definition exported: %s", json_path)
+            logger.info("  Instrument: %s", instrument_definition['instrumentName'])
+            logger.info("  Author: %s", instrument_definition['author'])
+            logger.info("  Category: %s", instrument_definition['category'])
+            logger.info("  Version: %s", instrument_definition['instrumentVersion'])
+            logger.info("  Sample Count: %s MIDI notes", instrument_definition['sampleCount'])
 
             return json_path
 
         except Exception as e:
-            logger.error(f"Failed to export instrument definition: {e}")
+            logger.error("Failed to export instrument definition: %s", e)
             raise
 
 
@@ -416,12 +488,12 @@ class ExportValidator:
                 midi_note, velocity = key
 
                 # Validace MIDI rozsahu
-                if not isinstance(midi_note, int) or not MidiUtils.is_piano_range(midi_note):
+                if not isinstance(midi_note, int) or not (_PIANO_MIN_MIDI <= midi_note <= _PIANO_MAX_MIDI):
                     errors.append(f"MIDI nota {midi_note} není v piano rozsahu")
 
                 # Validace velocity
-                if not isinstance(velocity, int) or not (EXPORT.Validation.MIN_VELOCITY <= velocity <= EXPORT.Validation.MAX_VELOCITY):
-                    errors.append(f"Velocity {velocity} není v rozsahu {EXPORT.Validation.MIN_VELOCITY}-{EXPORT.Validation.MAX_VELOCITY}")
+                if not isinstance(velocity, int) or not (_MIN_VELOCITY <= velocity <= _MAX_VELOCITY):
+                    errors.append(f"Velocity {velocity} není v rozsahu {_MIN_VELOCITY}-{_MAX_VELOCITY}")
 
                 # Validace sample objektu
                 if not isinstance(sample, SampleMetadata):
@@ -429,7 +501,8 @@ class ExportValidator:
                     continue
 
                 # Validace existence souboru
-                if not sample.filepath or not sample.filepath.exists():
+                filepath = sample.filepath
+                if not filepath or not filepath.exists():
                     errors.append(f"Soubor {sample.filename} neexistuje")
 
             except Exception as e:
@@ -46,11 +46,11 @@ class AudioFileLoader(IAudioFileLoader):
             try:
                 waveform, sr = sf.read(str(filepath))
                 channels = 1 if len(waveform.shape) == 1 else waveform.shape[1]
-                logger.debug(f"Loaded {filepath.name} with soundfile")
+                logger.debug("Loaded %s with soundfile", filepath.name)
                 return AudioData(waveform, sr, channels)
             except Exception as e:
                 errors.append(f"soundfile: {str(e)[:100]}")
-                logger.debug(f"Soundfile failed: {e}")
+                logger.debug("Soundfile failed: %s", e)
         
         # Pokus o librosa
         if LIBROSA_AVAILABLE:
@@ -59,15 +59,15 @@ class AudioFileLoader(IAudioFileLoader):
                 channels = 1 if len(waveform.shape) == 1 else waveform.shape[1]
                 if len(waveform.shape) == 1:
                     waveform = waveform.reshape(-1, 1)
-                logger.debug(f"Loaded {filepath.name} with librosa")
+                logger.debug("Loaded %s with librosa", filepath.name)
                 return AudioData(waveform, sr, channels)
             except Exception as e:
                 errors.append(f"librosa: {str(e)[:100]}")
-                logger.debug(f"Librosa failed: {e}")
+                logger.debug("Librosa failed: %s", e)
         
         # Chyba
         all_errors = "; ".join(errors)
-        logger.error(f"Failed to load {filepath.name}. Tried: {all_errors}")
+        logger.error("Failed to load %s. Tried: %s", filepath.name, all_errors)
         return None
     
     def get_audio_info(self, file_path: Path) -> Optional[dict]:
@@ -91,7 +91,7 @@ class AudioFileLoader(IAudioFileLoader):
                     "frames": info.frames
                 }
             except Exception as e:
-                logger.debug(f"Failed to get info: {e}")
+                logger.debug("Failed to get info: %s", e)
         
         return None
     
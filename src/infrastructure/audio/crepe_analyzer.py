@@ -1,6 +1,7 @@
 """
 CrepeAnalyzer - CREPE-based pitch detection analyzer.
 """
+import importlib.util
 import logging
 import numpy as np
 from typing import Dict, Any
@@ -10,13 +11,27 @@ from src.domain.interfaces.audio_analyzer import IPitchAnalyzer, PitchAnalysisRe
 
 logger = logging.getLogger(__name__)
 
-try:
-    import crepe
-    CREPE_AVAILABLE = True
-except ImportError:
-    CREPE_AVAILABLE = False
+# CREPE (a s ním TensorFlow) se importuje až při první analýze — import trvá
+# několik sekund a zdržoval by start aplikace, i když se nic neanalyzuje.
+CREPE_AVAILABLE = importlib.util.find_spec("crepe") is not None
+if not CREPE_AVAILABLE:
     logger.warning("CREPE not available")
 
+crepe = None
+
+
+def _load_crepe():
+    """Naimportuje CREPE při prvním použití; vrátí modul nebo None."""
+    global crepe, CREPE_AVAILABLE
+    if crepe is None and CREPE_AVAILABLE:
+        try:
+            import crepe as crepe_module
+            crepe = crepe_module
+        except ImportError as e:
+            CREPE_AVAILABLE = False
+            logger.warning("CREPE not available: %s", e)
+    return crepe
+
 
 class CrepeAnalyzer(IPitchAnalyzer):
     """Pitch analyzer using CREPE neural network."""
@@ -52,7 +67,7 @@ class CrepeAnalyzer(IPitchAnalyzer):
         Returns:
             PitchAnalysisResult s detekovanou MIDI notou
         """
-        if not CREPE_AVAILABLE:
+        if _load_crepe() is None:
             logger.warning("CREPE not available, using fallback")
             return self._fallback_detection(audio_data)
 
@@ -70,8 +85,8 @@ class CrepeAnalyzer(IPitchAnalyzer):
                 original_duration = len(waveform) / sr
                 waveform = waveform[:max_samples]
                 logger.debug(
-                    f"Truncated audio from {original_duration:.1f}s to "
-                    f"{self.max_analysis_duration}s for CREPE analysis"
+                    "Truncated audio from %.1fs to %ss for CREPE analysis",
+                    original_duration, self.max_analysis_duration
                 )
             
             # Run CREPE
@@ -98,7 +113,7 @@ class CrepeAnalyzer(IPitchAnalyzer):
             # Convert to MIDI
             midi_note = self._frequency_to_midi(detected_frequency)
             
-            logger.debug(f"CREPE detected: {detected_frequency:.1f}Hz (MIDI {midi_note}), conf: {avg_confidence:.2f}")
+            logger.debug("CREPE detected: %.1fHz (MIDI %s), conf: %.2f", detected_frequency, midi_note, avg_confidence)
             
             return PitchAnalysisResult(
                 detected_midi=midi_note,
@@ -108,7 +123,7 @@ class CrepeAnalyzer(IPitchAnalyzer):
             )
             
         except Exception as e:
-            logger.error(f"CREPE analysis failed: {e}")
+            logger.error("CREPE analysis failed: %s", e)
             return PitchAnalysisResult(method="crepe_error")
     
     def _fallback_detection(self, audio_data: AudioData) -> PitchAnalysisResult:
@@ -4,6 +4,7 @@ RMS Analyzer - Amplitude analysis pro velocity mapping.
 
 import numpy as np
 import logging
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Optional
 
 from src.domain.interfaces.audio_analyzer import (
@@ -14,6 +15,9 @@ from src.domain.interfaces.audio_analyzer import (
 
 logger = logging.getLogger(__name__)
 
+# Počet oken zpracovaných jedním np.percentile v _calculate_percentile_peak
+_PEAK_WINDOWS_PER_BLOCK = 2048
+
 
 class RmsAnalyzer(IAmplitudeAnalyzer):
     """
@@ -80,15 +84,16 @@ class RmsAnalyzer(IAmplitudeAnalyzer):
 
             # === dB konverze ===
             velocity_amplitude_db = self._to_db(velocity_amplitude)
-            peak_db = self._to_db(peak_amplitude)
-            full_rms_db = self._to_db(full_rms_amplitude)
-
-            logger.debug(
-                f"Velocity RMS (first {self.velocity_duration_ms}ms): "
-                f"{velocity_amplitude:.6f} ({velocity_amplitude_db:.1f} dB), "
-                f"Peak (P{self.percentile}): {peak_amplitude:.6f} ({peak_db:.1f} dB), "
-                f"Full RMS: {full_rms_amplitude:.6f} ({full_rms_db:.1f} dB)"
-            )
+
+            # Peak a full RMS v dB slouží jen pro debug výpis
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Velocity RMS (first %sms): %.6f (%.1f dB), "
+                    "Peak (P%s): %.6f (%.1f dB), Full RMS: %.6f (%.1f dB)",
+                    self.velocity_duration_ms, velocity_amplitude, velocity_amplitude_db,
+                    self.percentile, peak_amplitude, self._to_db(peak_amplitude),
+                    full_rms_amplitude, self._to_db(full_rms_amplitude)
+                )
 
             return AmplitudeAnalysisResult(
                 velocity_amplitude=float(velocity_amplitude),
@@ -99,7 +104,7 @@ class RmsAnalyzer(IAmplitudeAnalyzer):
             )
 
         except Exception as e:
-            logger.error(f"RMS amplitude analysis failed: {e}")
+            logger.error("RMS amplitude analysis failed: %s", e)
             return self._empty_result()
 
     def _calculate_rms(self, audio: np.ndarray) -> float:
@@ -124,21 +129,21 @@ class RmsAnalyzer(IAmplitudeAnalyzer):
         window_size = int(sr * self.window_ms / 1000.0)
         window_size = max(1, min(window_size, len(audio)))
 
-        # Sliding window pro peak detekci
-        peak_values = []
+        # Sliding window pro peak detekci - okna jsou pohled do |audio| bez
+        # kopie, percentil se počítá pro celý blok oken jedním voláním
         hop_size = max(1, window_size // 4)
+        windows = sliding_window_view(np.abs(audio), window_size)[::hop_size]
 
-        for i in range(0, len(audio) - window_size + 1, hop_size):
-            window = audio[i:i + window_size]
-            # Percentilová filtrace místo absolutního maxima
-            window_peak = np.percentile(np.abs(window), self.percentile)
-            peak_values.append(window_peak)
-
-        if not peak_values:
+        if len(windows) == 0:
             # Fallback na globální percentil
             return float(np.percentile(np.abs(audio), self.percentile))
-        else:
-            return float(np.max(peak_values))
+
+        # Po blocích, aby dočasná kopie pro percentil nerostla s délkou souboru
+        peak = 0.0
+        for start in range(0, len(windows), _PEAK_WINDOWS_PER_BLOCK):
+            block = windows[start:start + _PEAK_WINDOWS_PER_BLOCK]
+            peak = max(peak, float(np.percentile(block, self.percentile, axis=1).max()))
+        return peak
 
     def _to_db(self, amplitude: float) -> float:
         """Převede amplitudu na dB."""
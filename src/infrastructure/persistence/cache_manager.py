@@ -4,10 +4,13 @@ CacheManager - MD5 hash-based caching pro audio sample analysis.
 
 import hashlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
+from config import APP
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +23,11 @@ class Md5CacheManager:
     def __init__(self):
         """Inicializuje cache manager."""
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._validated: Dict[str, bool] = {}  # Vysledek _validate_cached_data pro kazdy hash
+        # (cesta, st_mtime_ns, st_size) -> MD5; nezmeneny soubor se znovu necte.
+        # LRU omezene APP.Cache.HASH_MEMO_MAX_ENTRIES, aby v dlouho bezicim
+        # serveru nerostlo s kazdym kdy hashovanym souborem
+        self._hash_memo: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
         logger.info("Md5CacheManager initialized")
 
     def get_cached_analysis(self, file_hash: str) -> Optional[Dict[str, Any]]:
@@ -33,8 +41,16 @@ class Md5CacheManager:
             Cached data nebo None
         """
         cached_data = self._cache.get(file_hash)
-        if cached_data and self._validate_cached_data(cached_data):
-            logger.debug(f"Cache hit for hash {file_hash[:8]}...")
+        if not cached_data:
+            return None
+
+        # Validace probehne jen jednou na zaznam - zaznam se meni jen pres cache_analysis
+        valid = self._validated.get(file_hash)
+        if valid is None:
+            valid = self._validated[file_hash] = self._validate_cached_data(cached_data)
+
+        if valid:
+            logger.debug("Cache hit for hash %s...", file_hash[:8])
             return cached_data
         return None
 
@@ -51,7 +67,8 @@ class Md5CacheManager:
         analysis_data["cache_version"] = "2.0"
         
         self._cache[file_hash] = analysis_data
-        logger.debug(f"Cached analysis for hash {file_hash[:8]}...")
+        self._validated.pop(file_hash, None)
+        logger.debug("Cached analysis for hash %s...", file_hash[:8])
 
     def load_cache_from_dict(self, cache_dict: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -61,7 +78,8 @@ class Md5CacheManager:
             cache_dict: Slovnik s cached daty
         """
         self._cache = cache_dict.copy()
-        logger.info(f"Loaded {len(self._cache)} entries from cache")
+        self._validated.clear()
+        logger.info("Loaded %s entries from cache", len(self._cache))
 
     def export_cache_to_dict(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -76,7 +94,8 @@ class Md5CacheManager:
         """Vycisti celou cache."""
         count = len(self._cache)
         self._cache.clear()
-        logger.info(f"Cache cleared: {count} entries removed")
+        self._validated.clear()
+        logger.info("Cache cleared: %s entries removed", count)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -107,9 +126,18 @@ class Md5CacheManager:
         Raises:
             FileNotFoundError: Pokud soubor neexistuje
         """
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File does not exist: {file_path}")
 
+        # Zmena obsahu zmeni mtime nebo velikost - pak se hash spocita znovu
+        memo_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        file_hash = self._hash_memo.get(memo_key)
+        if file_hash is not None:
+            self._hash_memo.move_to_end(memo_key)
+            return file_hash
+
         hash_md5 = hashlib.md5()
 
         try:
@@ -119,11 +147,14 @@ class Md5CacheManager:
                     hash_md5.update(chunk)
 
             file_hash = hash_md5.hexdigest()
-            logger.debug(f"Calculated hash for {file_path.name}: {file_hash[:8]}...")
+            self._hash_memo[memo_key] = file_hash
+            if len(self._hash_memo) > APP.Cache.HASH_MEMO_MAX_ENTRIES:
+                self._hash_memo.popitem(last=False)
+            logger.debug("Calculated hash for %s: %s...", file_path.name, file_hash[:8])
             return file_hash
 
         except Exception as e:
-            logger.error(f"Failed to calculate hash for {file_path}: {e}")
+            logger.error("Failed to calculate hash for %s: %s", file_path, e)
             raise
 
     def _validate_cached_data(self, cached_data: Dict[str, Any]) -> bool:
@@ -140,7 +171,7 @@ class Md5CacheManager:
         
         for key in required_keys:
             if key not in cached_data:
-                logger.warning(f"Missing key '{key}' in cached data")
+                logger.warning("Missing key '%s' in cached data", key)
                 return False
         
         # Kontroluj zda jsou pitch nebo amplitude data pritomny
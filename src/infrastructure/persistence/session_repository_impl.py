@@ -4,9 +4,10 @@ JsonSessionRepository - JSON-based persistence pro sessions.
 
 import json
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from src.domain.interfaces import ISessionRepository
@@ -39,7 +40,7 @@ class JsonSessionRepository(ISessionRepository):
         """
         self.sessions_folder = sessions_folder or Path("sessions")
         self.sessions_folder.mkdir(exist_ok=True)
-        logger.info(f"JsonSessionRepository initialized: {self.sessions_folder}")
+        logger.info("JsonSessionRepository initialized: %s", self.sessions_folder)
 
     def create(self, session_name: str) -> Dict[str, Any]:
         """Vytvori novou session."""
@@ -63,7 +64,7 @@ class JsonSessionRepository(ISessionRepository):
         }
 
         self.save(session_name, session_data)
-        logger.info(f"Created new session: {session_name}")
+        logger.info("Created new session: %s", session_name)
         return session_data
 
     def load(self, session_name: str) -> Optional[Dict[str, Any]]:
@@ -71,18 +72,18 @@ class JsonSessionRepository(ISessionRepository):
         session_file = self._get_session_file(session_name)
 
         if not session_file.exists():
-            logger.error(f"Session file not found: {session_file}")
+            logger.error("Session file not found: %s", session_file)
             return None
 
         try:
             with open(session_file, 'r', encoding='utf-8') as f:
                 session_data = json.load(f)
 
-            logger.info(f"Loaded session: {session_name}")
+            logger.info("Loaded session: %s", session_name)
             return session_data
 
         except Exception as e:
-            logger.error(f"Failed to load session {session_name}: {e}")
+            logger.error("Failed to load session %s: %s", session_name, e)
             return None
 
     def save(self, session_name: str, session_data: Dict[str, Any]) -> bool:
@@ -102,11 +103,11 @@ class JsonSessionRepository(ISessionRepository):
             with open(session_file, 'w', encoding='utf-8') as f:
                 json.dump(session_data, f, indent=2, ensure_ascii=False)
 
-            logger.debug(f"Session saved: {session_file}")
+            logger.debug("Session saved: %s", session_file)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save session {session_name}: {e}")
+            logger.error("Failed to save session %s: %s", session_name, e)
 
             # Pokus o obnoveni z backup
             backup_file = session_file.with_suffix('.json.backup')
@@ -122,15 +123,16 @@ class JsonSessionRepository(ISessionRepository):
 
     def list_sessions(self) -> List[str]:
         """Vrati seznam vsech dostupnych sessions."""
-        session_files = list(self.sessions_folder.glob("session-*.json"))
-        session_names = []
+        # Jeden pruchod os.scandir nad retezci - bez Path objektu pro kazdy soubor
+        with os.scandir(self.sessions_folder) as it:
+            session_names = [
+                entry.name[8:-5]  # session-<name>.json -> <name>
+                for entry in it
+                if entry.name.startswith("session-") and entry.name.endswith(".json")
+            ]
 
-        for file_path in session_files:
-            # Extrahuj nazev ze souboru session-<name>.json
-            name = file_path.stem[8:]  # Odstran "session-" prefix
-            session_names.append(name)
-
-        return sorted(session_names)
+        session_names.sort()
+        return session_names
 
     def delete(self, session_name: str) -> bool:
         """Smaze session."""
@@ -141,12 +143,20 @@ class JsonSessionRepository(ISessionRepository):
 
         try:
             session_file.unlink()
-            logger.info(f"Deleted session: {session_name}")
+            logger.info("Deleted session: %s", session_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete session {session_name}: {e}")
+            logger.error("Failed to delete session %s: %s", session_name, e)
             return False
 
+    def get_revision(self, session_name: str) -> Optional[Tuple[int, int]]:
+        """Vrati (mtime_ns, velikost) session souboru, nebo None pokud neexistuje."""
+        try:
+            st = self._get_session_file(session_name).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def _get_session_file(self, session_name: str) -> Path:
         """Vrati cestu k session souboru. Vyhodí ValueError pro neplatné názvy."""
         _validate_session_name(session_name)
@@ -2,9 +2,22 @@
 midi_utils.py - Utility funkce pro práci s MIDI notami
 """
 
+import functools
 from typing import List, Tuple
 from config import AUDIO
 
+# Předpočítané názvy not pro všechny MIDI hodnoty (index = MIDI číslo)
+_NOTE_NAME_TABLE: Tuple[str, ...] = tuple(
+    f"{AUDIO.MIDI.NOTE_NAMES[m % 12]}{(m // 12) - 1}"
+    for m in range(AUDIO.MIDI.MIN_MIDI, AUDIO.MIDI.MAX_MIDI + 1)
+)
+
+# Předpočítané frekvence v Hz pro všechny MIDI hodnoty (index = MIDI číslo)
+_MIDI_FREQ_TABLE: Tuple[float, ...] = tuple(
+    AUDIO.MIDI.A4_FREQUENCY * (2 ** ((m - AUDIO.MIDI.A4_MIDI) / 12))
+    for m in range(AUDIO.MIDI.MIN_MIDI, AUDIO.MIDI.MAX_MIDI + 1)
+)
+
 
 class MidiUtils:
     """Utility funkce pro MIDI operace"""
@@ -20,13 +33,14 @@ class MidiUtils:
         if not (AUDIO.MIDI.MIN_MIDI <= midi_note <= AUDIO.MIDI.MAX_MIDI):
             raise ValueError(f"MIDI nota musí být mezi {AUDIO.MIDI.MIN_MIDI}-{AUDIO.MIDI.MAX_MIDI}, dostáno: {midi_note}")
 
-        octave = (midi_note // 12) - 1
-        note_name = MidiUtils.NOTE_NAMES[midi_note % 12]
-        return f"{note_name}{octave}"
+        return _NOTE_NAME_TABLE[midi_note - AUDIO.MIDI.MIN_MIDI]
 
     @staticmethod
     def midi_to_frequency(midi_note: int) -> float:
         """Převede MIDI notu na frekvenci v Hz (A4 = 440 Hz)"""
+        # Celé MIDI noty z tabulky, ostatní (float, mimo rozsah) výpočtem
+        if type(midi_note) is int and AUDIO.MIDI.MIN_MIDI <= midi_note <= AUDIO.MIDI.MAX_MIDI:
+            return _MIDI_FREQ_TABLE[midi_note - AUDIO.MIDI.MIN_MIDI]
         return AUDIO.MIDI.A4_FREQUENCY * (2 ** ((midi_note - AUDIO.MIDI.A4_MIDI) / 12))
 
     @staticmethod
@@ -69,6 +83,7 @@ class MidiUtils:
         return list(range(start_midi, start_midi + 12))
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)  # 88 not * 8 velocity * formáty - vejde se celé
     def generate_filename(midi_note: int, velocity: int, sample_rate: int = None) -> str:
         """Generuje název souboru podle specifikace: mXXX-velY-fZZ.wav"""
         if not (AUDIO.Velocity.EXPORT_MIN <= velocity <= AUDIO.Velocity.EXPORT_MAX):
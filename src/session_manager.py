@@ -5,11 +5,13 @@ session_manager.py - Opravený Session management s MD5 hash cachingem
 import json
 import hashlib
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 
 from .models import SampleMetadata
+from .midi_utils import MidiUtils
 from config import SESSIONS_DIR
 
 logger = logging.getLogger(__name__)
@@ -41,15 +43,16 @@ class SessionManager:
 
     def get_available_sessions(self) -> List[str]:
         """Vrátí seznam dostupných session souborů."""
-        session_files = list(self.sessions_folder.glob("session-*.json"))
-        session_names = []
+        with os.scandir(self.sessions_folder) as it:
+            session_names = [
+                entry.name[8:-5]  # session-<name>.json -> <name>
+                for entry in it
+                if entry.name.startswith("session-") and entry.name.endswith(".json")
+            ]
 
-        for file_path in session_files:
-            # Extrahuj název ze souboru session-<name>.json
-            name = file_path.stem[8:]  # Odstraň "session-" prefix
-            session_names.append(name)
-
-        return sorted(session_names)
+        # Řazení na místě - bez další kopie seznamu
+        session_names.sort()
+        return session_names
 
     def create_new_session(self, session_name: str, velocity_layers: int = 4, metadata: dict = None) -> bool:
         """
@@ -423,7 +426,7 @@ class SessionManager:
 
             # Přepočítej frekvenci na základě nové MIDI noty
             if new_midi is not None:
-                new_frequency = 440.0 * (2 ** ((new_midi - 69) / 12))
+                new_frequency = MidiUtils.midi_to_frequency(new_midi)
                 cache_entry["detected_frequency"] = float(new_frequency)
 
             # Uprav timestamp
@@ -0,0 +1,39 @@
+"""
+Unit testy pro SessionService.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.application.services.session_service import SessionService
+from src.infrastructure.persistence import JsonSessionRepository
+
+
+@pytest.mark.unit
+class TestSessionService:
+    """Testy pro Session Service."""
+
+    def test_reload_of_unchanged_session_is_skipped(self, tmp_path):
+        """Opakovaný load nezměněné session soubor znovu neparsuje."""
+        repository = JsonSessionRepository(tmp_path)
+        service = SessionService(repository=repository)
+        service.create_session("demo")
+
+        with patch.object(repository, "load", wraps=repository.load) as load:
+            assert service.load_session("demo") is True
+            assert service.load_session("demo") is True
+            assert load.call_count == 0
+
+    def test_changed_session_is_reloaded(self, tmp_path):
+        """Změněný session soubor se načte znovu."""
+        repository = JsonSessionRepository(tmp_path)
+        service = SessionService(repository=repository)
+        service.create_session("demo")
+
+        data = repository.load("demo")
+        data["velocity_layers"] = 4
+        data["padding"] = "x" * 16  # změní velikost i při hrubém rozlišení mtime
+        repository.save("demo", data)
+
+        assert service.load_session("demo") is True
+        assert service.current_session_data["velocity_layers"] == 4
@@ -21,3 +21,16 @@ class TestSampleMetadata:
         sample.analyzed = True
         sample.detected_midi = 60
         assert sample.is_valid_for_mapping() is True
+
+    def test_pitch_info_formatting(self, tmp_path):
+        from src.domain.models import SampleMetadata
+        sample = SampleMetadata(tmp_path / "test.wav")
+        assert sample.get_pitch_info() == "No pitch detected"
+
+        sample.detected_midi = 60
+        assert sample.get_pitch_info() == "C4"
+
+        sample.detected_frequency = 261.63
+        sample.pitch_confidence = 0.95
+        sample.pitch_method = "crepe"
+        assert sample.get_pitch_info() == "C4 (261.6 Hz) (conf: 0.95) [crepe]"
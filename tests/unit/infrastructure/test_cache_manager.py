@@ -23,3 +23,48 @@ class TestMd5CacheManager:
         
         assert retrieved is not None
         assert retrieved["detected_midi"] == 60
+
+    def test_validation_result_is_cached_until_entry_changes(self):
+        from src.infrastructure.persistence import Md5CacheManager
+        cache = Md5CacheManager()
+        cache.cache_analysis("abc123", {"filename": "test.wav"})
+
+        assert cache.get_cached_analysis("abc123") is None
+        assert cache.get_cached_analysis("abc123") is None
+
+        cache.cache_analysis("abc123", {"filename": "test.wav", "detected_midi": 60})
+        assert cache.get_cached_analysis("abc123")["detected_midi"] == 60
+
+    def test_file_hash_is_reused_until_file_changes(self, tmp_path):
+        from src.infrastructure.persistence import Md5CacheManager
+        import os
+        cache = Md5CacheManager()
+        f = tmp_path / "a.wav"
+        f.write_bytes(b"abc")
+
+        first = cache.calculate_file_hash(f)
+        assert cache.calculate_file_hash(f) == first
+        assert len(cache._hash_memo) == 1
+
+        f.write_bytes(b"abcd")
+        os.utime(f, ns=(0, 1))
+        assert cache.calculate_file_hash(f) != first
+
+    def test_file_hash_memo_is_bounded(self, tmp_path, monkeypatch):
+        from config import APP
+        from src.infrastructure.persistence import Md5CacheManager
+        monkeypatch.setattr(APP.Cache, "HASH_MEMO_MAX_ENTRIES", 2)
+        cache = Md5CacheManager()
+        files = []
+        for name in ("a.wav", "b.wav", "c.wav"):
+            f = tmp_path / name
+            f.write_bytes(name.encode())
+            files.append(f)
+
+        cache.calculate_file_hash(files[0])
+        cache.calculate_file_hash(files[1])
+        cache.calculate_file_hash(files[0])  # a.wav je nejnoveji pouzity
+        cache.calculate_file_hash(files[2])
+
+        remembered = {key[0] for key in cache._hash_memo}
+        assert remembered == {str(files[0]), str(files[2])}
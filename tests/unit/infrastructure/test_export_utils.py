@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+
+@pytest.mark.unit
+class TestExportManager:
+    def test_export_reports_specific_failure_reasons(self, mock_wav_file, temp_dir):
+        """Nevalidní samples neblokují export, ale mají konkrétní důvod selhání."""
+        from src.export_utils import ExportManager, SampleCheck
+        from src.domain.models import SampleMetadata
+
+        good = SampleMetadata(mock_wav_file)
+        missing = SampleMetadata(temp_dir / "missing.wav")
+        manager = ExportManager(temp_dir / "export")
+
+        info = manager.export_mapped_samples({(60, 3): good, (61, 3): missing, (10, 3): good})
+
+        assert info['exported_count'] == 1
+        assert info['failed_count'] == 2
+        reasons = dict(info['failed_files'])
+        assert reasons["missing.wav"] == SampleCheck.MISSING_FILE.value
+        assert reasons[good.filename] == SampleCheck.MIDI_OUT_OF_RANGE.value
+
+    def test_strict_mode_rejects_invalid_mapping(self, mock_wav_file, temp_dir):
+        """Ve strict režimu se při validační chybě nic neexportuje."""
+        from src.export_utils import ExportManager
+        from src.domain.models import SampleMetadata
+
+        manager = ExportManager(temp_dir / "export")
+        with pytest.raises(ValueError):
+            manager.export_mapped_samples({(60, 9): SampleMetadata(mock_wav_file)}, strict=True)
+        assert not (temp_dir / "export").exists()
+
+    def test_resampled_output_keeps_duration(self, mock_wav_file, temp_dir):
+        """Streamovaný resampling zachová délku samplu v cílové sample rate."""
+        import soundfile as sf
+        from src.export_utils import ExportManager
+        from src.domain.models import SampleMetadata
+
+        manager = ExportManager(temp_dir / "export")
+        info = manager.export_mapped_samples({(60, 3): SampleMetadata(mock_wav_file)})
+
+        f48 = next(p for p in info['exported_files'] if p.name.endswith("-f48.wav"))
+        out = sf.info(str(f48))
+        assert out.samplerate == 48000
+        assert abs(out.frames - 48000) <= 1
+
+
+@pytest.mark.unit
+class TestExportValidator:
+    def test_validate_mapping_range_errors(self, mock_wav_file):
+        """Rozsahové chyby se hlásí pro každý neplatný klíč ve stejném pořadí."""
+        from src.export_utils import ExportValidator
+        from src.domain.models import SampleMetadata
+
+        sample = SampleMetadata(mock_wav_file)
+        errors = ExportValidator.validate_mapping({(60, 3): sample, (10, 3): sample, (60, 8): sample})
+
+        assert errors == [
+            "MIDI nota 10 není v piano rozsahu",
+            "Velocity 8 není v rozsahu 0-7",
+        ]
+
+    def test_validate_mapping_malformed_keys(self, mock_wav_file):
+        """Neplatné klíče nerozbijí kontrolu ostatních klíčů."""
+        from src.export_utils import ExportValidator
+        from src.domain.models import SampleMetadata
+
+        sample = SampleMetadata(mock_wav_file)
+        errors = ExportValidator.validate_mapping({(60, 3): sample, "bad": sample, (60.5, 2): sample})
+
+        assert errors == [
+            "Neplatný klíč v mapping: bad",
+            "MIDI nota 60.5 není v piano rozsahu",
+        ]
+
+    def test_validate_mapping_non_int_and_huge_keys(self, mock_wav_file):
+        """Obří a ne-int MIDI hodnoty se hlásí jako mimo rozsah, nevyhodí výjimku."""
+        import numpy as np
+        from src.export_utils import ExportValidator
+        from src.domain.models import SampleMetadata
+
+        sample = SampleMetadata(mock_wav_file)
+        errors = ExportValidator.validate_mapping({(10**20, 3): sample, (np.int64(61), 3): sample})
+
+        assert errors == [
+            f"MIDI nota {10**20} není v piano rozsahu",
+            "MIDI nota 61 není v piano rozsahu",
+        ]
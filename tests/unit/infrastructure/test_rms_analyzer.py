@@ -149,3 +149,18 @@ class TestRmsAnalyzer:
         assert result.velocity_amplitude > 0.0
         expected_rms = 0.5 / np.sqrt(2)
         assert abs(result.velocity_amplitude - expected_rms) < 0.01
+
+    def test_percentile_peak_matches_per_window_loop(self):
+        """Vektorový percentilový peak dá stejný výsledek jako výpočet okno po okně."""
+        sample_rate = 44100
+        audio = np.random.default_rng(0).standard_normal(sample_rate + 17)
+
+        analyzer = RmsAnalyzer()
+        window_size = int(sample_rate * analyzer.window_ms / 1000.0)
+        hop_size = window_size // 4
+        expected = max(
+            np.percentile(np.abs(audio[i:i + window_size]), analyzer.percentile)
+            for i in range(0, len(audio) - window_size + 1, hop_size)
+        )
+
+        assert analyzer._calculate_percentile_peak(audio, sample_rate) == pytest.approx(expected)